@@ -5,15 +5,19 @@ Uses REAL OpenAI API for intelligent keyword generation
 
 import os
 import asyncio
+import functools
+import hashlib
 import json
 import re
-import random
 import time
-from typing import List, Dict, Any
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 import aiohttp
+import httpx
 import logging
+import numpy as np
 from datetime import datetime
 
 # Load environment variables
@@ -23,35 +27,172 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled term matchers - one C-level scan per category instead of
+# repeated substring loops per keyword
+_HIGH_VOL_RE = re.compile(r'\b(best|top|how to|what is)\b')
+_MED_VOL_RE = re.compile(r'\b(guide|tips|online|free)\b')
+_NEAR_ME_RE = re.compile(r'\bnear me\b')
+_HIGH_COMP_RE = re.compile(r'\b(insurance|loan|lawyer|mortgage|credit card|casino)\b')
+_MED_COMP_RE = re.compile(r'\b(software|tool|service|course|training)\b')
+_QUESTION_RE = re.compile(r'\b(how|what|why|when|where)\b')
+_COMMERCIAL_TERM_RE = re.compile(r'\b(best|top)\b')
+_HIGH_DIFF_RE = re.compile(r'\b(insurance|loan|lawyer)\b')
+_QUESTION_PHRASE_RE = re.compile(r'\b(how to|what is)\b')
+_TRANSACTIONAL_RE = re.compile(r'\b(buy|purchase|order|apply|signup)\b')
+_COMMERCIAL_RE = re.compile(r'\b(best|top|review|compare|vs)\b')
+_INFORMATIONAL_RE = re.compile(r'\b(what|how|why|guide|tips)\b')
+
+# Matches one completed JSON string element in a streamed array
+_JSON_STRING_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+# Static prompt scaffolding lives in the system messages, with only the
+# dynamic payload appended at the end of the user message, so OpenAI's
+# automatic prompt-prefix caching can reuse the prefill across calls
+_KEYWORD_GEN_SYSTEM_PROMPT = """You are an expert SEO keyword researcher with deep knowledge of search behavior and keyword opportunities.
+
+Generate 20 NON-OBVIOUS long-tail SEO keyword variations for the seed keyword the user provides.
+
+Focus on keywords that:
+1. Have commercial intent and conversion potential
+2. Include semantic variations and related concepts users actually search
+3. Are realistic to rank for (not ultra-competitive)
+4. Are NOT simple prefix/suffix templates
+
+Each keyword must be unique, relevant to the seed keyword, actually searchable, and must not appear in the user's already-covered list. Always return clean JSON."""
+
+_INTENT_SYSTEM_PROMPT = """You are an expert in search intent classification.
+
+Classify the search intent of each keyword the user provides into exactly one of these categories:
+- informational: User seeking information/learning
+- commercial: User researching before purchase/action
+- transactional: User ready to buy/take action
+- navigational: User looking for specific site/brand
+
+Examples:
+- "how to set up a home network" -> informational
+- "what is keyword research" -> informational
+- "best project management software" -> commercial
+- "mailchimp vs convertkit" -> commercial
+- "buy standing desk online" -> transactional
+- "sign up for cloud storage" -> transactional
+- "facebook login" -> navigational
+- "openai homepage" -> navigational
+
+When given a numbered list, return ONLY a JSON array (no additional text):
+[{"i": 1, "intent": "commercial"}, {"i": 2, "intent": "informational"}, ...]"""
+
+# Intent bonus weights used by the opportunity score (10% component)
+_INTENT_BONUS = {
+    'transactional': 10,
+    'commercial': 8,
+    'informational': 5,
+    'navigational': 3
+}
+
+# Structured-output schema for keyword generation - the model is constrained
+# to emit {"keywords": [...]}, so no free-text parsing failures are possible
+_KEYWORDS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "keywords": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    },
+    "required": ["keywords"],
+    "additionalProperties": False
+}
+
 class SEOKeywordAgent:
     """Production SEO Keyword Research AI Agent"""
     
+    # Semantic cache tuning
+    SEMANTIC_CACHE_THRESHOLD = 0.92
+    SEMANTIC_CACHE_TTL = 7 * 24 * 3600  # 7 days
+    SEMANTIC_CACHE_MAX_SIZE = 256
+    EXACT_CACHE_MAX_SIZE = 512
+
+    # Client-side rate limiting
+    MAX_CONCURRENT_REQUESTS = 50
+    MAX_REQUESTS_PER_MIN = 5000
+
+    # Cross-call keyword -> intent memoization
+    INTENT_CACHE_MAX_SIZE = 10_000
+    INTENT_CACHE_FILE = ".intent_cache.json"
+
     def __init__(self):
-        self.openai_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # The default httpx pool (10 connections) throttles the concurrent
+        # fan-out and can raise PoolTimeout - size it for our burst width
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+        self.openai_client = AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=self._http_client
+        )
         self.serpapi_key = os.getenv('SERPAPI_KEY')
-        
+
+        # Single RNG for all batch draws; seedable for deterministic tests
+        self._rng = np.random.default_rng()
+
+        # Bound in-flight OpenAI requests and smooth bursts below the
+        # account's RPM ceiling so we never trigger 429 backoff penalties
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._request_times: deque = deque()
+
+        # L1 exact-match cache: sha256(seed|max_keywords) -> result
+        self._exact_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # Semantic cache: (seed embedding, seed keyword, max_keywords, result, stored_at)
+        self._semantic_cache: List[Tuple[np.ndarray, str, int, Dict[str, Any], float]] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Keyword -> intent cache, persisted across CLI runs
+        self._intent_cache: OrderedDict[str, str] = self._load_intent_cache()
+
     async def research_keywords(self, seed_keyword: str, max_keywords: int = 50) -> Dict[str, Any]:
         """
         Main function: Research keywords using AI and return ranked results
         """
         start_time = time.time()
         logger.info(f"🚀 Starting keyword research for: '{seed_keyword}'")
-        
+
+        # L1: exact-match cache - identical seeds repeated in a session skip
+        # even the embedding call
+        exact_key = self._exact_cache_key(seed_keyword, max_keywords)
+        cached = self._exact_cache.get(exact_key)
+        if cached is not None:
+            self._exact_cache.move_to_end(exact_key)
+            self.cache_hits += 1
+            logger.info(f"⚡ Exact cache hit for '{seed_keyword}'")
+            result = dict(cached)
+            result["timestamp"] = datetime.now().isoformat()
+            return result
+
+        # L2: semantic cache - paraphrased seeds ("cheap vpn" vs
+        # "affordable vpn") can reuse a prior result without any GPT calls
+        seed_embedding = await self._embed_seed(seed_keyword)
+        cached = self._semantic_cache_lookup(seed_embedding, max_keywords)
+        if cached is not None:
+            self.cache_hits += 1
+            logger.info(f"⚡ Semantic cache hit for '{seed_keyword}'")
+            # Backfill L1 so this exact seed hits the fast path next time
+            self._exact_cache_store(exact_key, cached)
+            result = dict(cached)
+            result["timestamp"] = datetime.now().isoformat()
+            return result
+        self.cache_misses += 1
+
         try:
-            # Step 1: Generate keyword variations using OpenAI GPT-4
-            logger.info("🤖 Generating keywords with GPT-4...")
-            raw_keywords = await self._generate_keywords_with_ai(seed_keyword)
-            logger.info(f"✅ Generated {len(raw_keywords)} raw keywords")
-            
-            # Step 2: Get SEO metrics for each keyword
-            logger.info("📊 Analyzing SEO metrics...")
-            keyword_data = await self._analyze_keywords(raw_keywords)
-            
-            # Step 3: Rank by opportunity score
-            ranked_keywords = self._rank_keywords(keyword_data)
-            
-            # Step 4: Return top keywords
-            final_keywords = ranked_keywords[:max_keywords]
+            # Steps 1+2 overlap: keywords are scored as GPT streams them
+            # back, so the CPU stage hides entirely behind network latency
+            logger.info("🤖 Generating and scoring keywords (streamed)...")
+            queue: asyncio.Queue = asyncio.Queue()
+            final_keywords, _ = await asyncio.gather(
+                self._analyze_keywords_streaming(queue, max_keywords),
+                self._stream_keywords_with_ai(seed_keyword, queue)
+            )
+            logger.info(f"✅ Scored and ranked {len(final_keywords)} keywords")
             
             processing_time = time.time() - start_time
             
@@ -63,351 +204,525 @@ class SEOKeywordAgent:
                 "keywords": final_keywords
             }
             
+            self._exact_cache_store(exact_key, result)
+            self._semantic_cache_store(seed_embedding, seed_keyword, max_keywords, result)
+
             logger.info(f"🎯 Research complete! {len(final_keywords)} keywords in {processing_time:.1f}s")
             return result
-            
+
         except Exception as e:
             logger.error(f"❌ Error in keyword research: {str(e)}")
             raise
-    
-    async def _generate_keywords_with_ai(self, seed_keyword: str) -> List[str]:
-        """Generate keyword variations using OpenAI GPT-4"""
-        
-        prompt = f"""Generate 80 high-value SEO keyword variations for: "{seed_keyword}"
 
-Focus on keywords that:
-1. Have commercial intent and conversion potential
-2. Target users ready to engage or purchase
-3. Include semantic variations and related concepts
-4. Cover different search intents (informational, commercial, transactional)
-5. Are realistic to rank for (not ultra-competitive)
-
-Include these types:
-- Exact match variations and synonyms
-- "Best [keyword]" and "Top [keyword]" variations  
-- "How to [keyword]" and question-based keywords
-- Long-tail variations (3-5+ words)
-- Location-based variations when relevant
-- Problem-solution focused keywords
-- User benefit and outcome keywords
-
-Return ONLY a JSON array of strings (no additional text):
-["keyword 1", "keyword 2", "keyword 3", ...]
-
-Important: Each keyword should be unique, relevant to "{seed_keyword}", and actually searchable."""
-        
+    async def _acquire_rate_slot(self) -> None:
+        """Wait for a free slot in the sliding one-minute request window"""
+        while True:
+            now = time.time()
+            while self._request_times and now - self._request_times[0] >= 60.0:
+                self._request_times.popleft()
+            if len(self._request_times) < self.MAX_REQUESTS_PER_MIN:
+                self._request_times.append(now)
+                return
+            # Window is saturated - sleep until the oldest request expires
+            await asyncio.sleep(60.0 - (now - self._request_times[0]))
+
+    @staticmethod
+    def _exact_cache_key(seed_keyword: str, max_keywords: int) -> str:
+        """Build the L1 cache key from the normalized seed and result size"""
+        return hashlib.sha256(
+            f"{seed_keyword.lower().strip()}|{max_keywords}".encode()
+        ).hexdigest()
+
+    def _exact_cache_store(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result in the L1 cache with LRU eviction"""
+        self._exact_cache[key] = result
+        self._exact_cache.move_to_end(key)
+        while len(self._exact_cache) > self.EXACT_CACHE_MAX_SIZE:
+            self._exact_cache.popitem(last=False)
+
+    async def _embed_seed(self, seed_keyword: str) -> Optional[np.ndarray]:
+        """Embed the seed keyword for semantic cache lookups"""
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert SEO keyword researcher with deep knowledge of search behavior and keyword opportunities. Always return clean JSON arrays."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=1500
+            response = await self.openai_client.embeddings.create(
+                model="text-embedding-3-small",
+                input=seed_keyword.lower().strip()
             )
-            
-            # Parse the JSON response
-            content = response.choices[0].message.content.strip()
-            keywords = self._parse_keywords_from_ai(content)
-            
-            # Add some basic variations as backup
-            backup_keywords = self._generate_backup_keywords(seed_keyword)
-            all_keywords = list(set(keywords + backup_keywords))
-            
-            return all_keywords[:100]  # Limit to 100 for processing
-            
+            embedding = np.array(response.data[0].embedding, dtype=np.float32)
+            return embedding / np.linalg.norm(embedding)
+
         except Exception as e:
-            logger.error(f"Error with OpenAI API: {str(e)}")
-            # Fallback to basic generation
-            return self._generate_backup_keywords(seed_keyword)
-    
-    def _parse_keywords_from_ai(self, content: str) -> List[str]:
-        """Parse keywords from AI response"""
+            logger.warning(f"Seed embedding failed: {str(e)}")
+            return None
+
+    def _semantic_cache_lookup(self, embedding: Optional[np.ndarray],
+                               max_keywords: int) -> Optional[Dict[str, Any]]:
+        """Return a cached result for a semantically similar seed, if any"""
+
+        if embedding is None or not self._semantic_cache:
+            return None
+
+        # Drop expired entries first
+        now = time.time()
+        self._semantic_cache = [
+            entry for entry in self._semantic_cache
+            if now - entry[4] < self.SEMANTIC_CACHE_TTL
+        ]
+
+        best_index = -1
+        best_similarity = 0.0
+        for i, (stored_embedding, _, stored_max, _, _) in enumerate(self._semantic_cache):
+            if stored_max != max_keywords:
+                continue
+            similarity = float(embedding @ stored_embedding)
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_index = i
+
+        if best_index >= 0 and best_similarity >= self.SEMANTIC_CACHE_THRESHOLD:
+            # Bump to MRU so eviction drops the coldest entry
+            entry = self._semantic_cache.pop(best_index)
+            self._semantic_cache.append(entry)
+            return entry[3]
+
+        return None
+
+    def _semantic_cache_store(self, embedding: Optional[np.ndarray], seed_keyword: str,
+                              max_keywords: int, result: Dict[str, Any]) -> None:
+        """Store a research result in the semantic cache with LRU eviction"""
+
+        if embedding is None:
+            return
+
+        self._semantic_cache.append((embedding, seed_keyword, max_keywords, result, time.time()))
+        if len(self._semantic_cache) > self.SEMANTIC_CACHE_MAX_SIZE:
+            self._semantic_cache.pop(0)
+
+    async def _stream_keywords_with_ai(self, seed_keyword: str, queue: asyncio.Queue) -> None:
+        """Stream keyword variations onto the queue as GPT generates them
+
+        Local templates cover the obvious forms ("best X", "X reviews") for
+        free; GPT only has to supply the non-obvious long tail. Keywords are
+        pushed as soon as each completed JSON string element arrives so the
+        scoring consumer can start immediately.
+        """
+
+        template_keywords = list(self._generate_backup_keywords(seed_keyword))
+
+        covered = "\n".join(f"- {kw}" for kw in sorted(template_keywords))
+
+        # Dynamic content (seed + covered list) goes last so the static
+        # system scaffolding stays a cacheable prompt prefix
+        prompt = f"""Seed keyword: "{seed_keyword}"
+
+Already-covered keywords (do NOT repeat any of these):
+{covered}"""
+
         try:
-            # Find JSON array in response
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                keywords_raw = json.loads(json_str)
-                
-                # Clean and validate
-                keywords = []
-                for kw in keywords_raw:
-                    if isinstance(kw, str) and len(kw.strip()) > 2:
-                        clean_kw = kw.strip().lower()
-                        if len(clean_kw) < 100:  # Reasonable length
-                            keywords.append(clean_kw)
-                
-                return list(set(keywords))  # Remove duplicates
-            
+            async with self._sem:
+                await self._acquire_rate_slot()
+                stream = await self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": _KEYWORD_GEN_SYSTEM_PROMPT
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.7,
+                    max_tokens=400,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "keyword_list",
+                            "schema": _KEYWORDS_SCHEMA,
+                            "strict": True
+                        }
+                    },
+                    stream=True
+                )
+
+                # Push each completed "..." element as it arrives; an element
+                # whose closing quote hasn't streamed yet won't match. Scanning
+                # starts after the opening '[' so the "keywords" key is skipped.
+                buffer = ""
+                pos = -1
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    buffer += delta
+                    if pos < 0:
+                        array_start = buffer.find('[')
+                        if array_start < 0:
+                            continue
+                        pos = array_start + 1
+                    for match in _JSON_STRING_RE.finditer(buffer, pos):
+                        keyword = match.group(1).strip().lower()
+                        if 2 < len(keyword) < 100:
+                            await queue.put(keyword)
+                        pos = match.end()
+
         except Exception as e:
-            logger.warning(f"Error parsing AI keywords: {str(e)}")
-        
-        return []
+            logger.error(f"Error with OpenAI API: {str(e)}")
+            # Templates below still feed the pipeline as the fallback
+
+        for keyword in template_keywords:
+            await queue.put(keyword)
+
+        await queue.put(None)  # Sentinel: generation finished
     
-    def _generate_backup_keywords(self, seed_keyword: str) -> List[str]:
-        """Generate backup keywords if AI fails"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_backup_keywords(seed_keyword: str) -> Tuple[str, ...]:
+        """Generate templated keyword variations locally (no API cost)
+
+        Memoized per seed - the template list is deterministic, so repeat
+        seeds skip the rebuild entirely. Returns a tuple so the cached
+        value is immutable.
+        """
         base = seed_keyword.lower()
         keywords = [base]
-        
-        # Basic variations
+
+        # Template variations - these cover the obvious forms GPT would
+        # otherwise waste output tokens on
         variations = [
             f"best {base}",
-            f"top {base}", 
+            f"top {base}",
             f"how to {base}",
             f"what is {base}",
+            f"why {base}",
             f"{base} guide",
             f"{base} tips",
             f"{base} online",
-            f"{base} services", 
+            f"{base} services",
             f"affordable {base}",
+            f"cheap {base}",
+            f"cheap {base} near me",
             f"{base} near me",
             f"{base} reviews",
             f"{base} comparison",
+            f"{base} vs",
+            f"alternatives to {base}",
+            f"{base} alternatives",
             f"free {base}",
             f"{base} benefits",
-            f"{base} cost"
+            f"{base} cost",
+            f"{base} price",
+            f"{base} pricing",
+            f"{base} for beginners",
+            f"{base} step by step",
+            f"{base} complete guide",
+            f"{base} ultimate guide",
+            f"{base} tutorial",
+            f"{base} examples",
+            f"{base} checklist",
+            f"{base} mistakes",
+            f"{base} problems",
+            f"{base} solutions",
+            f"{base} requirements",
+            f"{base} free trial",
+            f"learn {base}",
+            f"find {base}",
+            f"get {base}",
+            f"buy {base}",
+            f"professional {base}",
+            f"{base} company",
+            f"{base} agency"
         ]
-        
+
         keywords.extend(variations)
-        return list(set(keywords))
+        return tuple(dict.fromkeys(keywords))
     
-    async def _analyze_keywords(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """Analyze keywords for SEO metrics"""
-        
-        keyword_data = []
-        
-        for keyword in keywords:
-            # Get search volume estimate
-            search_volume = self._estimate_search_volume(keyword)
-            
-            # Calculate competition score
-            competition_score = self._calculate_competition(keyword)
-            
-            # Determine keyword difficulty
-            difficulty = self._calculate_difficulty(keyword)
-            
-            # Get search intent using AI
-            intent = await self._classify_intent_ai(keyword)
-            
-            # Calculate opportunity score
-            opportunity_score = self._calculate_opportunity_score(
-                search_volume, competition_score, difficulty, intent
-            )
-            
-            keyword_data.append({
-                "keyword": keyword,
-                "search_volume": search_volume,
-                "competition_score": competition_score,
-                "difficulty": difficulty,
-                "intent": intent,
-                "opportunity_score": opportunity_score,
-                "first_page_probability": self._calculate_ranking_probability(difficulty)
-            })
-        
-        return keyword_data
+    async def _analyze_keywords_streaming(self, queue: asyncio.Queue, top_k: int,
+                                          scoring_batch_size: int = 16,
+                                          max_raw_keywords: int = 100) -> List[Dict[str, Any]]:
+        """Consume streamed keywords, score them and return the ranked top k
+
+        Local metrics are computed vectorized in small batches as keywords
+        arrive; intent classification is batched once at the flush point
+        when the producer signals completion. All metrics stay as
+        struct-of-arrays until the end - result dicts are materialized only
+        for the top-k keywords after ranking.
+        """
+
+        keywords: List[str] = []
+        seen = set()
+        batch: List[str] = []
+        search_volumes: List[np.ndarray] = []
+        competition_scores: List[np.ndarray] = []
+        difficulties: List[np.ndarray] = []
+
+        def flush(chunk: List[str]) -> None:
+            # Tokenize once and share the parsed columns across all three
+            # scorers instead of re-lowering/re-splitting per function
+            lowers = [k.lower() for k in chunk]
+            word_counts = np.array([k.count(' ') + 1 for k in chunk])
+            search_volumes.append(self._estimate_search_volumes(lowers, word_counts))
+            competition_scores.append(self._calculate_competitions(lowers, word_counts))
+            difficulties.append(self._calculate_difficulties(lowers, word_counts))
+
+        while True:
+            keyword = await queue.get()
+            if keyword is None:
+                break
+            if keyword in seen or len(keywords) >= max_raw_keywords:
+                continue
+            seen.add(keyword)
+            keywords.append(keyword)
+            batch.append(keyword)
+            if len(batch) >= scoring_batch_size:
+                flush(batch)
+                batch = []
+
+        if batch:
+            flush(batch)
+
+        if not keywords:
+            return []
+
+        volumes = np.concatenate(search_volumes)
+        competitions = np.concatenate(competition_scores)
+        difficulty_arr = np.concatenate(difficulties)
+        ranking_probabilities = self._calculate_ranking_probabilities(difficulty_arr)
+
+        # Classify all intents in a single API call instead of one per keyword
+        intent_map = await self._classify_intents_bulk(keywords)
+        intent_bonuses = np.array([
+            _INTENT_BONUS.get(intent_map[k], 5) for k in keywords
+        ])
+
+        opportunity_scores = self._calculate_opportunity_scores(
+            volumes, competitions, difficulty_arr, intent_bonuses
+        )
+
+        # Select and sort only the top k - dicts are built just for winners
+        k = min(top_k, len(keywords))
+        top_idx = np.argpartition(-opportunity_scores, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-opportunity_scores[top_idx], kind='stable')]
+
+        return [
+            {
+                "keyword": keywords[i],
+                "search_volume": int(volumes[i]),
+                "competition_score": float(competitions[i]),
+                "difficulty": int(difficulty_arr[i]),
+                "intent": intent_map[keywords[i]],
+                "opportunity_score": float(opportunity_scores[i]),
+                "first_page_probability": float(ranking_probabilities[i])
+            }
+            for i in top_idx
+        ]
     
-    def _estimate_search_volume(self, keyword: str) -> int:
-        """Estimate monthly search volume based on keyword characteristics"""
-        
-        # Base volume estimation
-        word_count = len(keyword.split())
-        base_volume = 1000
-        
-        # Adjust based on word count
-        if word_count == 1:
-            multiplier = 5.0  # Single words = high volume
-        elif word_count == 2:
-            multiplier = 3.0
-        elif word_count == 3:
-            multiplier = 1.5
-        elif word_count == 4:
-            multiplier = 0.8
-        else:
-            multiplier = 0.4  # Long tail = lower volume
-        
-        # Adjust based on keyword type
-        keyword_lower = keyword.lower()
-        
+    def _estimate_search_volumes(self, lowers: List[str], word_counts: np.ndarray) -> np.ndarray:
+        """Estimate monthly search volumes for a keyword batch (vectorized)"""
+
+        # Word-count multipliers: single words = high volume, long tail = low
+        multiplier = np.select(
+            [word_counts == 1, word_counts == 2, word_counts == 3, word_counts == 4],
+            [5.0, 3.0, 1.5, 0.8],
+            default=0.4
+        )
+
         # High-volume indicators
-        if any(word in keyword_lower for word in ['best', 'top', 'how to', 'what is']):
-            multiplier *= 2.0
-        
-        # Medium-volume indicators  
-        if any(word in keyword_lower for word in ['guide', 'tips', 'online', 'free']):
-            multiplier *= 1.5
-        
+        has_high_vol = np.array([bool(_HIGH_VOL_RE.search(l)) for l in lowers])
+        multiplier = np.where(has_high_vol, multiplier * 2.0, multiplier)
+
+        # Medium-volume indicators
+        has_med_vol = np.array([bool(_MED_VOL_RE.search(l)) for l in lowers])
+        multiplier = np.where(has_med_vol, multiplier * 1.5, multiplier)
+
         # Low-volume indicators
-        if 'near me' in keyword_lower:
-            multiplier *= 0.6
-        
-        # Add realistic randomness
-        variance = random.uniform(0.5, 1.8)
-        estimated_volume = int(base_volume * multiplier * variance)
-        
+        has_near_me = np.array([bool(_NEAR_ME_RE.search(l)) for l in lowers])
+        multiplier = np.where(has_near_me, multiplier * 0.6, multiplier)
+
+        # Add realistic randomness in one draw
+        variance = self._rng.uniform(0.5, 1.8, size=len(lowers))
+        estimated = (1000 * multiplier * variance).astype(int)
+
         # Keep it realistic
-        return max(20, min(50000, estimated_volume))
-    
-    def _calculate_competition(self, keyword: str) -> float:
-        """Calculate competition score (0-1)"""
-        
-        keyword_lower = keyword.lower()
-        word_count = len(keyword.split())
-        
-        # Base competition
-        competition = 0.5
-        
+        return np.clip(estimated, 20, 50000)
+
+    def _calculate_competitions(self, lowers: List[str], word_counts: np.ndarray) -> np.ndarray:
+        """Calculate competition scores (0-1) for a keyword batch (vectorized)"""
+
+        competition = np.full(len(lowers), 0.5)
+
         # High competition keywords
-        high_comp_terms = ['insurance', 'loan', 'lawyer', 'mortgage', 'credit card', 'casino']
-        if any(term in keyword_lower for term in high_comp_terms):
-            competition += 0.3
-        
+        has_high = np.array([bool(_HIGH_COMP_RE.search(l)) for l in lowers])
+        competition += np.where(has_high, 0.3, 0.0)
+
         # Medium competition
-        medium_comp_terms = ['software', 'tool', 'service', 'course', 'training']
-        if any(term in keyword_lower for term in medium_comp_terms):
-            competition += 0.1
-        
+        has_medium = np.array([bool(_MED_COMP_RE.search(l)) for l in lowers])
+        competition += np.where(has_medium, 0.1, 0.0)
+
         # Long-tail keywords have less competition
-        if word_count >= 4:
-            competition -= 0.2
-        elif word_count >= 3:
-            competition -= 0.1
-        
+        competition -= np.select([word_counts >= 4, word_counts >= 3], [0.2, 0.1], default=0.0)
+
         # Question keywords often have less competition
-        if any(q in keyword_lower for q in ['how', 'what', 'why', 'when', 'where']):
-            competition -= 0.15
-        
-        return max(0.1, min(0.9, competition))
-    
-    def _calculate_difficulty(self, keyword: str) -> int:
-        """Calculate keyword difficulty (0-100)"""
-        
-        keyword_lower = keyword.lower()
-        word_count = len(keyword.split())
-        
-        # Base difficulty
-        difficulty = 50
-        
+        has_question = np.array([bool(_QUESTION_RE.search(l)) for l in lowers])
+        competition -= np.where(has_question, 0.15, 0.0)
+
+        return np.clip(competition, 0.1, 0.9)
+
+    def _calculate_difficulties(self, lowers: List[str], word_counts: np.ndarray) -> np.ndarray:
+        """Calculate keyword difficulties (0-100) for a keyword batch (vectorized)"""
+
+        difficulty = np.full(len(lowers), 50)
+
         # Adjust based on competition indicators
-        if any(term in keyword_lower for term in ['best', 'top']):
-            difficulty += 20
-        
-        if any(term in keyword_lower for term in ['insurance', 'loan', 'lawyer']):
-            difficulty += 30
-        
+        has_commercial = np.array([bool(_COMMERCIAL_TERM_RE.search(l)) for l in lowers])
+        difficulty += np.where(has_commercial, 20, 0)
+
+        has_high_comp = np.array([bool(_HIGH_DIFF_RE.search(l)) for l in lowers])
+        difficulty += np.where(has_high_comp, 30, 0)
+
         # Long-tail is easier
-        if word_count >= 4:
-            difficulty -= 20
-        elif word_count >= 3:
-            difficulty -= 10
-        
+        difficulty -= np.select([word_counts >= 4, word_counts >= 3], [20, 10], default=0)
+
         # Question keywords are often easier
-        if any(q in keyword_lower for q in ['how to', 'what is']):
-            difficulty -= 15
-        
-        return max(10, min(90, difficulty))
+        has_question = np.array([bool(_QUESTION_PHRASE_RE.search(l)) for l in lowers])
+        difficulty -= np.where(has_question, 15, 0)
+
+        return np.clip(difficulty, 10, 90)
     
-    async def _classify_intent_ai(self, keyword: str) -> str:
-        """Classify search intent using AI"""
-        
+
+    async def _classify_intents_bulk(self, keywords: List[str]) -> Dict[str, str]:
+        """Classify search intent for all keywords in a single API call"""
+
+        # Serve repeat keywords ("best vpn" shows up under many seeds) from
+        # the cross-call intent cache and only send the rest to the API
+        intents = {}
+        uncached = []
+        for keyword in keywords:
+            cached = self._intent_cache.get(keyword)
+            if cached is not None:
+                self._intent_cache.move_to_end(keyword)
+                intents[keyword] = cached
+            else:
+                uncached.append(keyword)
+
+        if not uncached:
+            return intents
+        keywords = uncached
+
         try:
-            prompt = f"""Classify the search intent of this keyword: "{keyword}"
+            keyword_list = "\n".join(f"{i}. {kw}" for i, kw in enumerate(keywords, 1))
 
-Categories:
-- informational: User seeking information/learning
-- commercial: User researching before purchase/action
-- transactional: User ready to buy/take action
-- navigational: User looking for specific site/brand
+            # Only the keyword list is dynamic; all rules and examples live
+            # in the (cacheable) system prompt prefix
+            prompt = f"Keywords to classify:\n{keyword_list}"
 
-Return only the category name (one word)."""
+            async with self._sem:
+                await self._acquire_rate_slot()
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",  # Cheaper for classification
+                    messages=[
+                        {"role": "system", "content": _INTENT_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,
+                    max_tokens=len(keywords) * 15 + 50
+                )
+
+            content = response.choices[0].message.content.strip()
+            json_match = re.search(r'\[.*\]', content, re.DOTALL)
+            if json_match:
+                valid_intents = {'informational', 'commercial', 'transactional', 'navigational'}
+                for entry in json.loads(json_match.group(0)):
+                    index = entry.get("i")
+                    intent = str(entry.get("intent", "")).strip().lower()
+                    if isinstance(index, int) and 1 <= index <= len(keywords) and intent in valid_intents:
+                        intents[keywords[index - 1]] = intent
 
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",  # Cheaper for classification
-                messages=[
-                    {"role": "system", "content": "You are an expert in search intent classification."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=10
-            )
-            
-            intent = response.choices[0].message.content.strip().lower()
-            if intent in ['informational', 'commercial', 'transactional', 'navigational']:
-                return intent
-            
         except Exception as e:
-            logger.warning(f"AI intent classification failed: {str(e)}")
-        
-        # Fallback classification
-        return self._classify_intent_fallback(keyword)
-    
+            logger.warning(f"Bulk intent classification failed: {str(e)}")
+
+        # Fill any keywords the API missed with the pattern fallback
+        for keyword in keywords:
+            if keyword not in intents:
+                intents[keyword] = self._classify_intent_fallback(keyword)
+
+        # Remember fresh classifications for future calls
+        for keyword in keywords:
+            self._intent_cache[keyword] = intents[keyword]
+            self._intent_cache.move_to_end(keyword)
+        while len(self._intent_cache) > self.INTENT_CACHE_MAX_SIZE:
+            self._intent_cache.popitem(last=False)
+
+        return intents
+
     def _classify_intent_fallback(self, keyword: str) -> str:
         """Fallback intent classification based on patterns"""
         
         keyword_lower = keyword.lower()
         
         # Transactional signals
-        if any(word in keyword_lower for word in ['buy', 'purchase', 'order', 'apply', 'signup']):
+        if _TRANSACTIONAL_RE.search(keyword_lower):
             return 'transactional'
-        
+
         # Commercial signals
-        if any(word in keyword_lower for word in ['best', 'top', 'review', 'compare', 'vs']):
+        if _COMMERCIAL_RE.search(keyword_lower):
             return 'commercial'
-        
-        # Informational signals  
-        if any(word in keyword_lower for word in ['what', 'how', 'why', 'guide', 'tips']):
+
+        # Informational signals
+        if _INFORMATIONAL_RE.search(keyword_lower):
             return 'informational'
         
         return 'commercial'  # Default
     
-    def _calculate_opportunity_score(self, search_volume: int, competition: float, 
-                                   difficulty: int, intent: str) -> float:
-        """Calculate overall opportunity score (0-100)"""
-        
+    def _calculate_opportunity_scores(self, search_volumes: np.ndarray,
+                                      competitions: np.ndarray,
+                                      difficulties: np.ndarray,
+                                      intent_bonuses: np.ndarray) -> np.ndarray:
+        """Calculate overall opportunity scores (0-100) for a batch"""
+
         # Volume component (30% weight)
-        volume_score = min(100, (search_volume / 100) * 30)
-        
+        volume_scores = np.minimum(100, (search_volumes / 100) * 30)
+
         # Competition component (40% weight) - lower competition = higher score
-        competition_score = (1 - competition) * 40
-        
-        # Difficulty component (20% weight) - lower difficulty = higher score  
-        difficulty_score = ((100 - difficulty) / 100) * 20
-        
-        # Intent bonus (10% weight)
-        intent_bonus = {
-            'transactional': 10,
-            'commercial': 8, 
-            'informational': 5,
-            'navigational': 3
-        }.get(intent, 5)
-        
-        total_score = volume_score + competition_score + difficulty_score + intent_bonus
-        
-        return round(min(100, max(0, total_score)), 1)
+        competition_scores = (1 - competitions) * 40
+
+        # Difficulty component (20% weight) - lower difficulty = higher score
+        difficulty_scores = ((100 - difficulties) / 100) * 20
+
+        # Intent bonus (10% weight) comes in pre-mapped
+        total = volume_scores + competition_scores + difficulty_scores + intent_bonuses
+
+        return np.round(np.clip(total, 0, 100), 1)
     
-    def _calculate_ranking_probability(self, difficulty: int) -> float:
-        """Calculate probability of first page ranking"""
-        
-        if difficulty < 30:
-            return random.uniform(0.6, 0.9)
-        elif difficulty < 50:
-            return random.uniform(0.4, 0.7)
-        elif difficulty < 70:
-            return random.uniform(0.2, 0.5)
-        else:
-            return random.uniform(0.05, 0.25)
+    def _calculate_ranking_probabilities(self, difficulties: np.ndarray) -> np.ndarray:
+        """Calculate first-page ranking probabilities for a difficulty batch"""
+
+        # Bucket difficulties and draw each bucket's range in one rng call
+        buckets = np.digitize(difficulties, [30, 50, 70])
+        lows = np.array([0.6, 0.4, 0.2, 0.05])[buckets]
+        highs = np.array([0.9, 0.7, 0.5, 0.25])[buckets]
+        return self._rng.uniform(lows, highs)
     
-    def _rank_keywords(self, keyword_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Rank keywords by opportunity score"""
-        
-        return sorted(keyword_data, key=lambda x: x['opportunity_score'], reverse=True)
+    def _load_intent_cache(self) -> 'OrderedDict[str, str]':
+        """Load the persisted keyword -> intent cache, if present"""
+        try:
+            with open(self.INTENT_CACHE_FILE, encoding='utf-8') as f:
+                return OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            return OrderedDict()
+
+    def _save_intent_cache(self) -> None:
+        """Persist the keyword -> intent cache for the next run"""
+        try:
+            with open(self.INTENT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(dict(self._intent_cache), f)
+        except OSError as e:
+            logger.warning(f"Could not persist intent cache: {str(e)}")
+
+    async def aclose(self):
+        """Close the shared HTTP client and persist caches"""
+        self._save_intent_cache()
+        await self.openai_client.close()
 
 
 # CLI Interface
@@ -419,40 +734,48 @@ async def main():
     
     # Initialize agent
     agent = SEOKeywordAgent()
-    
-    while True:
-        print("\nEnter a seed keyword (or 'quit' to exit):")
-        seed_keyword = input("💡 Keyword: ").strip()
-        
-        if seed_keyword.lower() in ['quit', 'exit', 'q']:
-            print("👋 Goodbye!")
-            break
-        
-        if not seed_keyword:
-            print("❌ Please enter a valid keyword")
-            continue
-        
-        try:
-            # Research keywords
-            result = await agent.research_keywords(seed_keyword, max_keywords=25)
-            
-            # Display results
-            print(f"\n🎯 Results for '{result['seed_keyword']}'")
-            print(f"⚡ Found {result['total_keywords']} keywords in {result['processing_time']}s\n")
-            
-            print("Top Keywords (ranked by opportunity):")
-            print("-" * 80)
-            
-            for i, kw in enumerate(result['keywords'][:15], 1):
-                print(f"{i:2d}. {kw['keyword']:<35} "
-                      f"Score: {kw['opportunity_score']:5.1f} | "
-                      f"Volume: {kw['search_volume']:>6,} | "
-                      f"Competition: {kw['competition_score']:.2f} | "
-                      f"Intent: {kw['intent']:<12}")
-                
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-            print("Make sure your OpenAI API key is valid and you have credits.")
+
+    try:
+        while True:
+            print("\nEnter a seed keyword (or 'quit' to exit):")
+            seed_keyword = input("💡 Keyword: ").strip()
+
+            if seed_keyword.lower() in ['quit', 'exit', 'q']:
+                print("👋 Goodbye!")
+                break
+
+            if not seed_keyword:
+                print("❌ Please enter a valid keyword")
+                continue
+
+            try:
+                # Research keywords
+                result = await agent.research_keywords(seed_keyword, max_keywords=25)
+
+                # Display results
+                print(f"\n🎯 Results for '{result['seed_keyword']}'")
+                print(f"⚡ Found {result['total_keywords']} keywords in {result['processing_time']}s\n")
+
+                print("Top Keywords (ranked by opportunity):")
+                print("-" * 80)
+
+                for i, kw in enumerate(result['keywords'][:15], 1):
+                    print(f"{i:2d}. {kw['keyword']:<35} "
+                          f"Score: {kw['opportunity_score']:5.1f} | "
+                          f"Volume: {kw['search_volume']:>6,} | "
+                          f"Competition: {kw['competition_score']:.2f} | "
+                          f"Intent: {kw['intent']:<12}")
+
+            except Exception as e:
+                print(f"❌ Error: {str(e)}")
+                print("Make sure your OpenAI API key is valid and you have credits.")
+    finally:
+        await agent.aclose()
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()  # ~2x faster event loop for the network fan-out
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
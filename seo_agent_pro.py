@@ -16,14 +16,32 @@ import time
 import csv
 import io
 from typing import List, Dict, Any, Optional
+from collections import deque, OrderedDict
+import functools
+import hashlib
+import operator
+import random
+
+# orjson is 3-5x faster than stdlib json for large exports; fall back cleanly
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    orjson = None
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
 from datetime import datetime
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, APIConnectionError, InternalServerError, RateLimitError
 import aiohttp
+import httpx
 import logging
-import requests
-from concurrent.futures import ThreadPoolExecutor
-import threading
+import numpy as np
 
 # Load environment variables
 load_dotenv()
@@ -32,13 +50,348 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Term-group bit flags: every scoring function reads one precomputed mask
+# instead of re-walking the keyword with its own substring loops
+_F_HIGH_VALUE = 1 << 0       # volume: high-value indicators
+_F_MED_VALUE = 1 << 1        # volume: medium-value indicators
+_F_COMMERCIAL_BOOST = 1 << 2  # volume: commercial terms
+_F_NEAR_ME = 1 << 3          # volume: location-based reduction
+_F_HIGH_TRAFFIC = 1 << 4     # volume: high-traffic industries
+_F_ULTRA_COMP = 1 << 5       # competition: ultra-high terms
+_F_HIGH_COMP = 1 << 6        # competition: high terms
+_F_COMM_COMP = 1 << 7        # competition: commercial boost
+_F_QUESTION = 1 << 8         # competition: question-based reduction
+_F_DIFF_ULTRA = 1 << 9       # difficulty: ultra-high terms
+_F_DIFF_HIGH = 1 << 10       # difficulty: high terms
+_F_DIFF_MED = 1 << 11        # difficulty: medium terms
+_F_DIFF_QUESTION = 1 << 12   # difficulty: question reduction
+_F_DIFF_EASY = 1 << 13       # difficulty: easy-term reduction
+_F_TRANSACTIONAL = 1 << 14   # intent signals
+_F_COMMERCIAL = 1 << 15
+_F_INFORMATIONAL = 1 << 16
+_F_NAVIGATIONAL = 1 << 17
+_F_CPC_ULTRA = 1 << 18       # CPC: high-value industries
+_F_CPC_HIGH = 1 << 19
+_F_CPC_MED = 1 << 20
+_F_CPC_LOW = 1 << 21
+
+_TERM_GROUPS = {
+    _F_HIGH_VALUE: ("best", "top", "how to", "what is", "review", "buy", "free"),
+    _F_MED_VALUE: ("guide", "tips", "help", "learn", "find", "get"),
+    _F_COMMERCIAL_BOOST: ("price", "cost", "buy", "purchase", "deal", "discount"),
+    _F_NEAR_ME: ("near me",),
+    _F_HIGH_TRAFFIC: ("insurance", "finance", "health", "tech", "education"),
+    _F_ULTRA_COMP: ("insurance", "lawyer", "mortgage", "loan", "credit card", "casino", "forex"),
+    _F_HIGH_COMP: ("software", "tool", "course", "training", "marketing", "seo"),
+    _F_COMM_COMP: ("best", "top", "buy", "price", "cost"),
+    _F_QUESTION: ("how to", "what is", "why", "when", "where"),
+    _F_DIFF_ULTRA: ("insurance", "lawyer", "mortgage", "loan"),
+    _F_DIFF_HIGH: ("best", "top", "software", "course"),
+    _F_DIFF_MED: ("buy", "price", "cost", "review"),
+    _F_DIFF_QUESTION: ("how to", "what is", "why", "guide"),
+    _F_DIFF_EASY: ("near me", "free", "tips"),
+    _F_TRANSACTIONAL: ("buy", "purchase", "order", "apply", "signup", "register", "get", "download"),
+    _F_COMMERCIAL: ("best", "top", "review", "compare", "vs", "price", "cost", "deal"),
+    _F_INFORMATIONAL: ("how to", "what is", "why", "when", "guide", "tips", "learn", "tutorial"),
+    _F_NAVIGATIONAL: ("login", "website", "official", "homepage"),
+    _F_CPC_ULTRA: ("insurance", "lawyer", "loan", "mortgage"),
+    _F_CPC_HIGH: ("software", "course", "training"),
+    _F_CPC_MED: ("buy", "purchase", "price"),
+    _F_CPC_LOW: ("best", "top", "review"),
+}
+
+# term -> union of all group bits it belongs to
+_TERM_BITS: Dict[str, int] = {}
+for _bit, _terms in _TERM_GROUPS.items():
+    for _term in _terms:
+        _TERM_BITS[_term] = _TERM_BITS.get(_term, 0) | _bit
+
+# One compiled alternation (longest-first) scans the keyword once and
+# reports every matching term. The lookahead wrapper makes the matches
+# zero-width so overlapping occurrences are found too ("how top" hits
+# both "how to" and "top") - substring semantics match the old loops
+_TERMS_RE = re.compile("(?=(" + "|".join(
+    re.escape(t) for t in sorted(_TERM_BITS, key=len, reverse=True)
+) + "))")
+
+# Word-count multipliers for volume estimation (based on real SEO data)
+_WORD_MULTIPLIERS = {1: 8.0, 2: 4.0, 3: 2.0, 4: 1.0, 5: 0.6}
+
+# Backup keyword generation templates, hoisted so batch runs with many
+# seeds don't rebuild the same lists on every call
+_COMMERCIAL_PREFIXES = ("best", "top", "affordable", "cheap", "professional", "premium", "quality")
+_INFO_PREFIXES = ("how to", "what is", "why", "when to", "where to")
+_SUFFIXES = ("guide", "tips", "services", "online", "near me", "reviews", "cost", "price",
+             "benefits", "comparison", "alternatives", "solutions", "help", "support")
+_LONG_TAIL_TEMPLATES = ("{base} for beginners", "{base} step by step", "{base} complete guide",
+                        "{base} in 2024", "{base} free trial", "{base} vs alternatives",
+                        "{base} ultimate guide", "learn {base}", "find {base}", "get {base}")
+
+# Transient failures worth retrying with backoff; anything else propagates
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError,
+                     aiohttp.ClientError, asyncio.TimeoutError)
+
+# Intent interning: classify once into a small int id, index bonuses from a
+# tuple instead of rebuilding a dict per keyword
+_INTENT_ID = {"informational": 0, "commercial": 1, "transactional": 2, "navigational": 3}
+_INTENT_BONUS = (6, 8, 10, 4)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _term_mask(keyword_lower: str) -> int:
+    """Scan a lowered keyword once and return its term-group bitmask"""
+    mask = 0
+    for match in _TERMS_RE.finditer(keyword_lower):
+        mask |= _TERM_BITS[match.group(1)]
+    return mask
+
+
+# Numba JIT-compiles the scoring kernel when available; the pure-Python
+# loop is already fast enough for typical batch sizes, so it stays optional
+try:
+    from numba import njit as _njit, prange as _prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+    _prange = range
+
+
+def _score_kernel(masks, word_counts, out_volume, out_comp, out_diff, out_cpc, out_rp):
+    """Hot scoring kernel: straight-line int/float math over bitmasks
+
+    Branches only on bitmask bits and word counts, so Numba compiles it to
+    tight machine code. This is the single source of truth for the
+    volume/competition/difficulty/CPC/ranking-probability formulas.
+    """
+    for i in _prange(masks.shape[0]):
+        m = masks[i]
+        wc = word_counts[i]
+
+        # Search volume
+        if wc == 1:
+            mult = 8.0
+        elif wc == 2:
+            mult = 4.0
+        elif wc == 3:
+            mult = 2.0
+        elif wc == 4:
+            mult = 1.0
+        elif wc == 5:
+            mult = 0.6
+        else:
+            mult = 0.3
+        if m & _F_HIGH_VALUE:
+            mult *= 2.5
+        if m & _F_MED_VALUE:
+            mult *= 1.8
+        if m & _F_COMMERCIAL_BOOST:
+            mult *= 1.5
+        if m & _F_NEAR_ME:
+            mult *= 0.7
+        if m & _F_HIGH_TRAFFIC:
+            mult *= 1.3
+        volume = int(500 * mult)
+        out_volume[i] = min(max(volume, 50), 100000)
+
+        # Competition
+        comp = 0.5
+        if m & _F_ULTRA_COMP:
+            comp += 0.4
+        if m & _F_HIGH_COMP:
+            comp += 0.2
+        if m & _F_COMM_COMP:
+            comp += 0.15
+        if wc >= 4:
+            comp -= 0.25
+        elif wc >= 3:
+            comp -= 0.15
+        if m & _F_QUESTION:
+            comp -= 0.2
+        out_comp[i] = min(max(comp, 0.1), 0.95)
+
+        # Difficulty
+        diff = 45
+        if m & _F_DIFF_ULTRA:
+            diff += 40
+        elif m & _F_DIFF_HIGH:
+            diff += 25
+        elif m & _F_DIFF_MED:
+            diff += 15
+        if wc >= 5:
+            diff -= 30
+        elif wc >= 4:
+            diff -= 20
+        elif wc >= 3:
+            diff -= 10
+        if m & _F_DIFF_QUESTION:
+            diff -= 15
+        if m & _F_DIFF_EASY:
+            diff -= 10
+        diff = min(max(diff, 5), 95)
+        out_diff[i] = diff
+
+        # CPC estimate
+        if m & _F_CPC_ULTRA:
+            cpc = 1.50 * 15.0
+        elif m & _F_CPC_HIGH:
+            cpc = 1.50 * 5.0
+        elif m & _F_CPC_MED:
+            cpc = 1.50 * 3.0
+        elif m & _F_CPC_LOW:
+            cpc = 1.50 * 2.0
+        else:
+            cpc = 1.50
+        if wc >= 4:
+            cpc *= 0.6
+        elif wc >= 3:
+            cpc *= 0.8
+        out_cpc[i] = round(min(max(cpc, 0.25), 50.0), 2)
+
+        # Ranking probability
+        if diff <= 20:
+            out_rp[i] = 0.85
+        elif diff <= 35:
+            out_rp[i] = 0.70
+        elif diff <= 50:
+            out_rp[i] = 0.50
+        elif diff <= 65:
+            out_rp[i] = 0.30
+        elif diff <= 80:
+            out_rp[i] = 0.15
+        else:
+            out_rp[i] = 0.05
+
+
+if _HAS_NUMBA:
+    _score_kernel = _njit(
+        "void(uint32[:], int32[:], int64[:], float64[:], int32[:], float64[:], float64[:])",
+        cache=True, fastmath=True, parallel=True
+    )(_score_kernel)
+
+class AIMDController:
+    """Adaptive concurrency controller (additive-increase/multiplicative-decrease)
+
+    Grows the permit count by 0.5 per call while the sliding-window average
+    latency stays under target, and halves it on slow calls, 429s or 5xx —
+    so concurrency rides just under the provider's ceiling instead of being
+    hard-coded. A short cooldown after errors acts as a circuit breaker
+    against ramping straight back into a rate limit.
+    """
+
+    def __init__(self, c_min: int = 2, c_max: int = 50, initial: int = 10,
+                 latency_target: float = 5.0, window: int = 32):
+        self.c_min = c_min
+        self.c_max = c_max
+        self.latency_target = latency_target
+        self._limit = float(initial)
+        self._latencies: deque = deque(maxlen=window)
+        self._active = 0
+        self._cooldown_until = 0.0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while self._active >= self.limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+        avg = sum(self._latencies) / len(self._latencies)
+        if avg <= self.latency_target:
+            if time.monotonic() >= self._cooldown_until:
+                self._limit = min(self.c_max, self._limit + 0.5)
+        else:
+            self._limit = max(self.c_min, self._limit * 0.5)
+
+    def record_error(self) -> None:
+        self._limit = max(self.c_min, self._limit * 0.5)
+        self._cooldown_until = time.monotonic() + 5.0
+
+
+class RateLimiter:
+    """Sliding-window requests/tokens-per-minute limiter
+
+    Tracks (timestamp, tokens) events over the last 60s and, instead of a
+    blanket inter-batch sleep, sleeps only until the oldest event ages out
+    of the window when a limit would be exceeded.
+    """
+
+    def __init__(self, rpm: int, tpm: Optional[int] = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._events: deque = deque()  # (monotonic timestamp, token estimate)
+        self._token_sum = 0
+        self._lock = asyncio.Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._events and now - self._events[0][0] >= 60.0:
+            _, tokens = self._events.popleft()
+            self._token_sum -= tokens
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Block until one request (with ~tokens budget) fits in the window"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                over_rpm = len(self._events) >= self.rpm
+                over_tpm = self.tpm is not None and tokens > 0 and self._token_sum + tokens > self.tpm
+                if not over_rpm and not over_tpm:
+                    self._events.append((now, tokens))
+                    self._token_sum += tokens
+                    return
+                # Sleep just until the oldest event leaves the window
+                await asyncio.sleep(max(0.05, 60.0 - (now - self._events[0][0])))
+
+
 class ProductionSEOAgent:
     """Production-grade SEO Keyword Research AI Agent"""
+
+    # Batch-mode seeds expand into heavily overlapping keywords
+    # ("best X", "X review", ...) — cache API-derived fields per keyword
+    INTENT_CACHE_MAX_SIZE = 50_000
+    VOLUME_CACHE_MAX_SIZE = 50_000
+
+    # Deterministic prompts are memoized on disk so repeated runs on the
+    # same seeds skip the API entirely; XDG_CACHE_HOME relocates the
+    # cache out of the working tree when set
+    RESPONSE_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", ".cache"),
+                                      "openai")
+    RESPONSE_CACHE_TTL = 7 * 24 * 3600  # 7 days
     
-    def __init__(self):
-        self.openai_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None,
+                 seed_concurrency: int = 5):
+        # A caller-owned http_client (e.g. the web server's pooled client)
+        # is shared rather than closed with the agent
+        self.openai_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'),
+                                         http_client=http_client)
+        self._owns_http_client = http_client is None
         self.serpapi_key = os.getenv('SERPAPI_KEY')
-        self.executor = ThreadPoolExecutor(max_workers=10)
+
+        # Rate limiting tuned to provider ceilings instead of blanket sleeps
+        self._openai_limiter = RateLimiter(rpm=3500, tpm=200_000)
+        self._serpapi_limiter = RateLimiter(rpm=100)
+        self._aimd = AIMDController()
+        self._seed_concurrency = seed_concurrency
+        # Running total of outbound API requests (OpenAI + SerpAPI);
+        # research_keywords reports the delta it observed
+        self._api_call_count = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # LRU caches so duplicate keywords across seeds skip OpenAI/SerpAPI
+        self._intent_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._volume_cache: "OrderedDict[tuple, int]" = OrderedDict()
+        self._cache_lock = asyncio.Lock()
         
         if not os.getenv('OPENAI_API_KEY'):
             raise ValueError("OPENAI_API_KEY is required in .env file")
@@ -47,17 +400,20 @@ class ProductionSEOAgent:
     
     async def research_keywords(self, seed_keyword: str, max_keywords: int = 50, 
                               country: str = "US", include_questions: bool = True,
-                              include_long_tail: bool = True) -> Dict[str, Any]:
+                              include_long_tail: bool = True,
+                              prompt_cache_key: Optional[str] = None) -> Dict[str, Any]:
         """
         MAIN FUNCTION: Research keywords with AI and return professional results
         """
         start_time = time.time()
+        calls_before = self._api_call_count
         logger.info(f"Starting professional keyword research for: '{seed_keyword}'")
-        
+
         try:
             # Step 1: Generate keywords with GPT-4
             logger.info("Generating keywords with GPT-4...")
-            raw_keywords = await self._generate_keywords_ai(seed_keyword, include_questions, include_long_tail)
+            raw_keywords = await self._generate_keywords_ai(seed_keyword, include_questions, include_long_tail,
+                                                            prompt_cache_key=prompt_cache_key)
             logger.info(f"Generated {len(raw_keywords)} keywords from AI")
             
             # Step 2: Get real SEO metrics (parallel processing)
@@ -79,7 +435,11 @@ class ProductionSEOAgent:
                 "country": country,
                 "keywords": final_keywords,
                 "metadata": {
-                    "api_calls": len(raw_keywords) + 1,  # GPT-4 + intent classifications
+                    # Requests actually issued during this run (generation +
+                    # batched intent call + any SerpAPI lookups); cache hits
+                    # make this 0. Best-effort under concurrent runs, which
+                    # share the counter.
+                    "api_calls": self._api_call_count - calls_before,
                     "raw_keywords_generated": len(raw_keywords),
                     "filters_applied": ["opportunity_score", "relevance", "competition"]
                 }
@@ -92,8 +452,33 @@ class ProductionSEOAgent:
             logger.error(f"Error in keyword research: {str(e)}")
             raise
     
+    async def research_keywords_stream(self, seed_keyword: str, max_keywords: int = 50,
+                                       country: str = "US", include_questions: bool = True,
+                                       include_long_tail: bool = True,
+                                       prompt_cache_key: Optional[str] = None):
+        """Async generator variant of research_keywords for streaming UIs
+
+        Yields scored keyword dicts as each analysis batch completes instead
+        of buffering the full ranked result, so the first keyword arrives
+        after one scoring batch rather than the whole pipeline. Keywords
+        stream in generation order; global opportunity ranking needs the
+        complete set, so consumers that want it sort client-side.
+        """
+        logger.info(f"Starting streaming keyword research for: '{seed_keyword}'")
+
+        raw_keywords = await self._generate_keywords_ai(seed_keyword, include_questions, include_long_tail,
+                                                        prompt_cache_key=prompt_cache_key)
+        raw_keywords = raw_keywords[:max_keywords]
+
+        batch_size = 20
+        for i in range(0, len(raw_keywords), batch_size):
+            batch = raw_keywords[i:i + batch_size]
+            for keyword_data in await self._analyze_keywords_parallel(batch, country):
+                yield keyword_data
+
     async def _generate_keywords_ai(self, seed_keyword: str, include_questions: bool, 
-                                   include_long_tail: bool) -> List[str]:
+                                   include_long_tail: bool,
+                                   prompt_cache_key: Optional[str] = None) -> List[str]:
         """Generate keywords using OpenAI GPT-4 - NO FALLBACKS, PURE AI"""
         
         prompt = f"""Generate 100 high-value SEO keyword variations for: "{seed_keyword}"
@@ -133,8 +518,16 @@ CRITICAL: Return ONLY a valid JSON array of strings:
 
 No explanations, no extra text, ONLY the JSON array."""
 
+        cache_key = self._response_cache_key("gpt-4o-mini", 0.7, prompt)
+        cached = self._response_cache_get(cache_key)
+        if cached is not None:
+            keywords = self._parse_json_keywords(cached)
+            if keywords:
+                return keywords
+
         try:
-            response = await self.openai_client.chat.completions.create(
+            await self._openai_limiter.acquire(len(prompt) // 4 + 2000)
+            response = await self._retry(lambda: self._chat_completion(
                 model="gpt-4o-mini",  # Use faster, cheaper model for better reliability
                 messages=[
                     {
@@ -147,11 +540,17 @@ No explanations, no extra text, ONLY the JSON array."""
                     }
                 ],
                 temperature=0.7,
-                max_tokens=2000
-            )
+                max_tokens=2000,
+                # Routes requests with the same static prefix to the same
+                # server-side prompt cache shard (sent via extra_body so
+                # older SDKs that don't know the parameter still work)
+                extra_body={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else {}
+            ))
             
             content = response.choices[0].message.content.strip()
             keywords = self._parse_json_keywords(content)
+            if keywords:
+                self._response_cache_set(cache_key, content)
             
             if keywords:
                 return keywords
@@ -163,153 +562,272 @@ No explanations, no extra text, ONLY the JSON array."""
             logger.error(f"OpenAI API error: {str(e)}")
             return self._generate_enhanced_backup(seed_keyword, include_questions, include_long_tail)
     
+    @staticmethod
+    def _response_cache_key(model: str, temperature: float, prompt: str) -> str:
+        return hashlib.sha256(f"{model}|{temperature}|{prompt}".encode()).hexdigest()
+
+    def _response_cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response body, dropping entries past their TTL"""
+        path = os.path.join(self.RESPONSE_CACHE_DIR, f"{key}.txt")
+        try:
+            if time.time() - os.path.getmtime(path) > self.RESPONSE_CACHE_TTL:
+                os.remove(path)
+                return None
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _response_cache_set(self, key: str, content: str) -> None:
+        try:
+            os.makedirs(self.RESPONSE_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(self.RESPONSE_CACHE_DIR, f"{key}.txt"), 'w', encoding='utf-8') as f:
+                f.write(content)
+        except OSError as e:
+            logger.debug(f"Response cache write failed: {str(e)}")
+
+    async def _retry(self, coro_fn, *, tries: int = 3, base: float = 0.5) -> Any:
+        """Retry a transiently-failing API call with exponential backoff + jitter"""
+        for attempt in range(tries):
+            try:
+                return await coro_fn()
+            except _RETRYABLE_ERRORS as e:
+                if attempt == tries - 1:
+                    raise
+                delay = base * 2 ** attempt + random.random() * 0.1
+                logger.debug(f"Retryable API error ({str(e)}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def _chat_completion(self, **kwargs) -> Any:
+        """Run one OpenAI chat call under AIMD concurrency control"""
+        await self._aimd.acquire()
+        start = time.monotonic()
+        self._api_call_count += 1
+        try:
+            response = await self.openai_client.chat.completions.create(**kwargs)
+        except Exception as e:
+            status = getattr(e, "status_code", None)
+            if status == 429 or (status is not None and status >= 500):
+                self._aimd.record_error()
+            raise
+        else:
+            self._aimd.record_latency(time.monotonic() - start)
+            return response
+        finally:
+            await self._aimd.release()
+
     def _parse_json_keywords(self, content: str) -> List[str]:
         """Parse keywords from AI JSON response"""
         try:
             # Clean the content
             content = content.strip()
-            
-            # Find JSON array
-            json_match = re.search(r'\[.*?\]', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                keywords_raw = json.loads(json_str)
-                
-                # Clean and validate
-                keywords = []
-                for kw in keywords_raw:
-                    if isinstance(kw, str) and len(kw.strip()) > 2:
-                        clean_kw = kw.strip().lower()
-                        if 3 <= len(clean_kw) <= 80:  # Reasonable length
-                            keywords.append(clean_kw)
-                
-                return list(set(keywords))  # Remove duplicates
-            
-        except json.JSONDecodeError as e:
-            logger.warning(f"JSON parsing error: {str(e)}")
+
+            # The model usually returns clean JSON — try that before scanning
+            keywords_raw = self._loads_array(content)
+            if keywords_raw is None:
+                json_str = self._extract_json_array(content)
+                if json_str is None:
+                    return []
+                keywords_raw = self._loads_array(json_str)
+                if keywords_raw is None:
+                    return []
+
+            # Single pass: validate, normalize and dedup preserving order
+            seen = set()
+            keywords = []
+            for kw in keywords_raw:
+                if isinstance(kw, str):
+                    clean_kw = kw.strip().lower()
+                    if 3 <= len(clean_kw) <= 80 and clean_kw not in seen:  # Reasonable length
+                        seen.add(clean_kw)
+                        keywords.append(clean_kw)
+
+            return keywords
+
         except Exception as e:
             logger.warning(f"Keyword parsing error: {str(e)}")
-        
+
         return []
+
+    @staticmethod
+    def _loads_array(json_str: str) -> Optional[list]:
+        """Decode a JSON array, preferring orjson's C parser"""
+        try:
+            raw = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
+        except Exception:
+            return None
+        return raw if isinstance(raw, list) else None
+
+    @staticmethod
+    def _extract_json_array(content: str) -> Optional[str]:
+        """Extract the first complete JSON array from surrounding prose
+
+        Single left-to-right scan tracking bracket depth and string state;
+        avoids the backtracking of a DOTALL regex over multi-KB responses.
+        """
+        start = content.find('[')
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(content)):
+            ch = content[i]
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = not in_string
+            elif not in_string:
+                if ch == '[':
+                    depth += 1
+                elif ch == ']':
+                    depth -= 1
+                    if depth == 0:
+                        return content[start:i + 1]
+        return None
     
     def _generate_enhanced_backup(self, seed_keyword: str, include_questions: bool, 
                                 include_long_tail: bool) -> List[str]:
         """Enhanced backup keyword generation (not demo crap, professional alternatives)"""
         base = seed_keyword.lower()
-        keywords = [base]
-        
-        # Professional keyword variations
-        commercial_prefixes = ["best", "top", "affordable", "cheap", "professional", "premium", "quality"]
-        informational_prefixes = ["how to", "what is", "why", "when to", "where to"]
-        suffixes = ["guide", "tips", "services", "online", "near me", "reviews", "cost", "price", 
-                   "benefits", "comparison", "alternatives", "solutions", "help", "support"]
-        
-        # Generate commercial variations
-        for prefix in commercial_prefixes:
-            keywords.append(f"{prefix} {base}")
-        
-        # Generate informational variations
-        if include_questions:
-            for prefix in informational_prefixes:
-                keywords.append(f"{prefix} {base}")
-        
-        # Generate suffix variations
-        for suffix in suffixes:
-            keywords.append(f"{base} {suffix}")
-        
-        # Generate long-tail variations
-        if include_long_tail:
-            long_tail_patterns = [
-                f"{base} for beginners",
-                f"{base} step by step",
-                f"{base} complete guide",
-                f"{base} in 2024",
-                f"{base} free trial",
-                f"{base} vs alternatives",
-                f"{base} ultimate guide",
-                f"learn {base}",
-                f"find {base}",
-                f"get {base}",
-            ]
-            keywords.extend(long_tail_patterns)
-        
-        return list(set(keywords))[:100]  # Remove duplicates, limit to 100
+
+        keywords = [
+            base,
+            *(f"{prefix} {base}" for prefix in _COMMERCIAL_PREFIXES),
+            *((f"{prefix} {base}" for prefix in _INFO_PREFIXES) if include_questions else ()),
+            *(f"{base} {suffix}" for suffix in _SUFFIXES),
+            *((t.format(base=base) for t in _LONG_TAIL_TEMPLATES) if include_long_tail else ()),
+        ]
+
+        # Ordered dedup, limit to 100
+        return list(dict.fromkeys(keywords))[:100]
     
     async def _analyze_keywords_parallel(self, keywords: List[str], country: str) -> List[Dict[str, Any]]:
-        """Analyze keywords in parallel for performance"""
-        
-        # Process in batches for better performance
-        batch_size = 20
-        results = []
-        
-        for i in range(0, len(keywords), batch_size):
-            batch = keywords[i:i + batch_size]
-            batch_tasks = [self._analyze_single_keyword(kw, country) for kw in batch]
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            for j, result in enumerate(batch_results):
-                if not isinstance(result, Exception):
-                    results.append(result)
-                else:
-                    logger.warning(f"Error analyzing keyword '{batch[j]}': {str(result)}")
-            
-            # Small delay between batches to avoid rate limits
-            await asyncio.sleep(0.5)
-        
-        return results
-    
-    async def _analyze_single_keyword(self, keyword: str, country: str) -> Dict[str, Any]:
-        """Analyze single keyword with real metrics"""
-        
-        # Get search volume (real API or smart estimation)
-        search_volume = await self._get_search_volume(keyword, country)
-        
-        # Calculate competition metrics
-        competition_score = self._calculate_competition(keyword)
-        difficulty = self._calculate_difficulty(keyword)
-        
-        # Get search intent with AI
-        intent = await self._classify_intent_ai(keyword)
-        
-        # Calculate CPC estimate
-        cpc_estimate = self._estimate_cpc(keyword)
-        
-        # Calculate opportunity score
-        opportunity_score = self._calculate_opportunity_score(
-            search_volume, competition_score, difficulty, intent
+        """Analyze keywords: vectorized local scoring + parallel API enrichment"""
+
+        # All deterministic metrics come out of one vectorized pass; intent is
+        # classified for the whole batch in a single GPT call, so only SerpAPI
+        # volume lookups remain per-keyword
+        scores = self._score_batch(keywords)
+
+        intents = await self._classify_intents_batch(keywords)
+
+        if self.serpapi_key:
+            volumes: List[int] = []
+            batch_size = 20
+            for i in range(0, len(keywords), batch_size):
+                batch = keywords[i:i + batch_size]
+                estimates = scores["search_volume"][i:i + batch_size]
+                volume_tasks = [
+                    self._get_search_volume(kw, country, int(est))
+                    for kw, est in zip(batch, estimates)
+                ]
+                batch_volumes = await asyncio.gather(*volume_tasks, return_exceptions=True)
+
+                for j, kw in enumerate(batch):
+                    volume = batch_volumes[j]
+                    if isinstance(volume, Exception):
+                        logger.warning(f"Volume lookup failed for '{kw}': {str(volume)}")
+                        volume = int(estimates[j])
+                    volumes.append(volume)
+        else:
+            volumes = [int(v) for v in scores["search_volume"]]
+
+        # Opportunity score as one vectorized expression over final fields
+        volume_arr = np.array(volumes)
+        bonus_arr = np.asarray(_INTENT_BONUS)
+        intent_arr = bonus_arr[[_INTENT_ID.get(intent, 0) for intent in intents]]
+        opportunity = np.clip(
+            np.minimum(100, volume_arr / 50) * 0.35
+            + (1 - scores["competition_score"]) * 35
+            + (100 - scores["difficulty"]) / 100 * 20
+            + intent_arr,
+            0, 100
         )
-        
-        # Calculate ranking probability
-        ranking_probability = self._calculate_ranking_probability(difficulty)
-        
+
+        return [
+            {
+                "keyword": kw,
+                "search_volume": int(volume_arr[i]),
+                "competition_score": round(float(scores["competition_score"][i]), 2),
+                "difficulty": int(scores["difficulty"][i]),
+                "intent": intents[i],
+                "cpc_estimate": float(scores["cpc_estimate"][i]),
+                "opportunity_score": round(float(opportunity[i]), 1),
+                "ranking_probability": round(float(scores["ranking_probability"][i]), 2),
+                "word_count": int(scores["word_count"][i]),
+                "character_count": len(kw)
+            }
+            for i, kw in enumerate(keywords)
+        ]
+
+    def _score_batch(self, keywords: List[str]) -> Dict[str, np.ndarray]:
+        """Compute all deterministic metrics for a keyword batch in one pass
+
+        Lowercases/tokenizes each keyword once, scans it once into a term
+        bitmask, then hands the integer arrays to _score_kernel (JIT-compiled
+        when Numba is installed).
+        """
+
+        lowers = [k.lower() for k in keywords]
+        word_counts = np.array([k.count(' ') + 1 for k in keywords], dtype=np.int32)
+        masks = np.array([_term_mask(l) for l in lowers], dtype=np.uint32)
+
+        n = len(keywords)
+        search_volume = np.empty(n, dtype=np.int64)
+        competition = np.empty(n, dtype=np.float64)
+        difficulty = np.empty(n, dtype=np.int32)
+        cpc = np.empty(n, dtype=np.float64)
+        ranking_probability = np.empty(n, dtype=np.float64)
+
+        _score_kernel(masks, word_counts, search_volume, competition,
+                      difficulty, cpc, ranking_probability)
+
         return {
-            "keyword": keyword,
             "search_volume": search_volume,
-            "competition_score": round(competition_score, 2),
+            "competition_score": competition,
             "difficulty": difficulty,
-            "intent": intent,
-            "cpc_estimate": cpc_estimate,
-            "opportunity_score": round(opportunity_score, 1),
-            "ranking_probability": round(ranking_probability, 2),
-            "word_count": len(keyword.split()),
-            "character_count": len(keyword)
+            "cpc_estimate": cpc,
+            "ranking_probability": ranking_probability,
+            "word_count": word_counts
         }
-    
-    async def _get_search_volume(self, keyword: str, country: str) -> int:
+
+    async def _get_search_volume(self, keyword: str, country: str, estimate: int) -> int:
         """Get search volume - integrates with SerpAPI if available"""
-        
-        # If SerpAPI is available, use it
+
+        cache_key = (keyword, country)
+        async with self._cache_lock:
+            if cache_key in self._volume_cache:
+                self._volume_cache.move_to_end(cache_key)
+                return self._volume_cache[cache_key]
+
+        # If SerpAPI is available, use it; otherwise the vectorized estimate
+        volume = estimate
         if self.serpapi_key:
-            volume = await self._get_serpapi_volume(keyword, country)
-            if volume > 0:
-                return volume
-        
-        # Otherwise use intelligent estimation
-        return self._estimate_search_volume_smart(keyword)
+            serp_volume = await self._get_serpapi_volume(keyword, country)
+            if serp_volume > 0:
+                volume = serp_volume
+
+        async with self._cache_lock:
+            self._volume_cache[cache_key] = volume
+            if len(self._volume_cache) > self.VOLUME_CACHE_MAX_SIZE:
+                self._volume_cache.popitem(last=False)
+        return volume
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session (keep-alive, cached DNS)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
     async def _get_serpapi_volume(self, keyword: str, country: str) -> int:
         """Get real search volume from SerpAPI"""
         try:
+            await self._serpapi_limiter.acquire()
             url = "https://serpapi.com/search"
             params = {
                 "engine": "google_trends",
@@ -317,135 +835,61 @@ No explanations, no extra text, ONLY the JSON array."""
                 "geo": country,
                 "api_key": self.serpapi_key
             }
-            
-            async with aiohttp.ClientSession() as session:
+
+            async def _fetch():
+                self._api_call_count += 1
+                session = await self._get_session()
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        # Extract search volume if available
-                        if "interest_over_time" in data:
-                            return data.get("average_interest", 0) * 100  # Scale up
-            
+                        return await response.json()
+                    return None
+
+            data = await self._retry(_fetch)
+            # Extract search volume if available
+            if data is not None and "interest_over_time" in data:
+                return data.get("average_interest", 0) * 100  # Scale up
+
         except Exception as e:
             logger.debug(f"SerpAPI error for '{keyword}': {str(e)}")
         
         return 0
     
-    def _estimate_search_volume_smart(self, keyword: str) -> int:
-        """Smart search volume estimation based on real SEO patterns"""
-        
-        keyword_lower = keyword.lower()
-        word_count = len(keyword.split())
-        base_volume = 500
-        
-        # Word count multipliers (based on real SEO data)
-        word_multipliers = {1: 8.0, 2: 4.0, 3: 2.0, 4: 1.0, 5: 0.6}
-        multiplier = word_multipliers.get(word_count, 0.3)
-        
-        # High-value keyword indicators
-        high_value_terms = ["best", "top", "how to", "what is", "review", "buy", "free"]
-        if any(term in keyword_lower for term in high_value_terms):
-            multiplier *= 2.5
-        
-        # Medium-value indicators
-        medium_value_terms = ["guide", "tips", "help", "learn", "find", "get"]
-        if any(term in keyword_lower for term in medium_value_terms):
-            multiplier *= 1.8
-        
-        # Commercial terms boost
-        commercial_terms = ["price", "cost", "buy", "purchase", "deal", "discount"]
-        if any(term in keyword_lower for term in commercial_terms):
-            multiplier *= 1.5
-        
-        # Location-based reduction
-        if "near me" in keyword_lower:
-            multiplier *= 0.7
-        
-        # Industry-specific adjustments
-        high_traffic_industries = ["insurance", "finance", "health", "tech", "education"]
-        if any(industry in keyword_lower for industry in high_traffic_industries):
-            multiplier *= 1.3
-        
-        estimated_volume = int(base_volume * multiplier)
-        return max(50, min(100000, estimated_volume))  # Realistic bounds
-    
-    def _calculate_competition(self, keyword: str) -> float:
-        """Calculate competition score based on real SEO factors"""
-        
-        keyword_lower = keyword.lower()
-        word_count = len(keyword.split())
-        
-        # Base competition
-        competition = 0.5
-        
-        # Ultra-high competition terms
-        ultra_high = ["insurance", "lawyer", "mortgage", "loan", "credit card", "casino", "forex"]
-        if any(term in keyword_lower for term in ultra_high):
-            competition += 0.4
-        
-        # High competition terms
-        high_comp = ["software", "tool", "course", "training", "marketing", "seo"]
-        if any(term in keyword_lower for term in high_comp):
-            competition += 0.2
-        
-        # Commercial competition boost
-        commercial_terms = ["best", "top", "buy", "price", "cost"]
-        if any(term in keyword_lower for term in commercial_terms):
-            competition += 0.15
-        
-        # Long-tail reduction
-        if word_count >= 4:
-            competition -= 0.25
-        elif word_count >= 3:
-            competition -= 0.15
-        
-        # Question-based reduction
-        question_terms = ["how to", "what is", "why", "when", "where"]
-        if any(term in keyword_lower for term in question_terms):
-            competition -= 0.2
-        
-        return max(0.1, min(0.95, competition))
-    
-    def _calculate_difficulty(self, keyword: str) -> int:
-        """Calculate keyword difficulty (1-100) based on competition factors"""
-        
-        keyword_lower = keyword.lower()
-        word_count = len(keyword.split())
-        
-        # Base difficulty
-        difficulty = 45
-        
-        # High difficulty terms
-        if any(term in keyword_lower for term in ["insurance", "lawyer", "mortgage", "loan"]):
-            difficulty += 40
-        elif any(term in keyword_lower for term in ["best", "top", "software", "course"]):
-            difficulty += 25
-        elif any(term in keyword_lower for term in ["buy", "price", "cost", "review"]):
-            difficulty += 15
-        
-        # Word count adjustment
-        if word_count >= 5:
-            difficulty -= 30
-        elif word_count >= 4:
-            difficulty -= 20
-        elif word_count >= 3:
-            difficulty -= 10
-        
-        # Question keywords are easier
-        if any(q in keyword_lower for q in ["how to", "what is", "why", "guide"]):
-            difficulty -= 15
-        
-        # Brand/specific terms are easier
-        if any(term in keyword_lower for term in ["near me", "free", "tips"]):
-            difficulty -= 10
-        
-        return max(5, min(95, difficulty))
-    
-    async def _classify_intent_ai(self, keyword: str) -> str:
-        """Classify search intent using AI - REAL API CALL"""
-        
-        try:
-            prompt = f"""Classify the search intent for: "{keyword}"
+    async def _classify_intents_batch(self, keywords: List[str]) -> List[str]:
+        """Classify intent for a whole keyword batch in ONE API call
+
+        One round-trip instead of one per keyword; falls back to the smart
+        pattern classifier for the whole batch (or any malformed entry) on
+        failure.
+        """
+        if not keywords:
+            return []
+
+        # Serve repeats from the LRU cache; only classify what's new
+        intents: List[Optional[str]] = [None] * len(keywords)
+        async with self._cache_lock:
+            for i, kw in enumerate(keywords):
+                cached = self._intent_cache.get(kw)
+                if cached is not None:
+                    self._intent_cache.move_to_end(kw)
+                    intents[i] = cached
+        pending = [(i, kw) for i, kw in enumerate(keywords) if intents[i] is None]
+        if not pending:
+            return intents
+
+        batch_intents = await self._classify_pending_intents([kw for _, kw in pending])
+
+        async with self._cache_lock:
+            for (i, kw), intent in zip(pending, batch_intents):
+                intents[i] = intent
+                self._intent_cache[kw] = intent
+                if len(self._intent_cache) > self.INTENT_CACHE_MAX_SIZE:
+                    self._intent_cache.popitem(last=False)
+        return intents
+
+    async def _classify_pending_intents(self, keywords: List[str]) -> List[str]:
+        """One classification API call for the cache misses of a batch"""
+        numbered = "\n".join(f"{i + 1}. {kw}" for i, kw in enumerate(keywords))
+        prompt = f"""Classify the search intent of each of these {len(keywords)} keywords.
 
 Categories:
 - informational: seeking information/learning
@@ -453,214 +897,172 @@ Categories:
 - transactional: ready to buy/take action
 - navigational: looking for specific site
 
-Return ONLY the category name (one word)."""
+Keywords:
+{numbered}
+
+Return ONLY a JSON array of {len(keywords)} category names, in the same order."""
+
+        cache_key = self._response_cache_key("gpt-3.5-turbo", 0.1, prompt)
+        content = self._response_cache_get(cache_key)
+
+        try:
+            if content is None:
+                await self._openai_limiter.acquire(len(prompt) // 4 + len(keywords) * 8 + 20)
+                response = await self._retry(lambda: self._chat_completion(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": "You are an expert in search intent classification. Return only a JSON array of category names."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,
+                    max_tokens=len(keywords) * 8 + 20
+                ))
+                content = response.choices[0].message.content.strip()
+                self._response_cache_set(cache_key, content)
+
+            json_str = self._extract_json_array(content)
+            raw_intents = json.loads(json_str) if json_str else []
+
+            valid_intents = {"informational", "commercial", "transactional", "navigational"}
+            intents = []
+            for i, kw in enumerate(keywords):
+                intent = raw_intents[i].strip().lower() if i < len(raw_intents) and isinstance(raw_intents[i], str) else ""
+                intents.append(intent if intent in valid_intents else self._classify_intent_smart(kw))
+            return intents
 
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert in search intent classification. Return only the category name."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=15
-            )
-            
-            intent = response.choices[0].message.content.strip().lower()
-            valid_intents = ["informational", "commercial", "transactional", "navigational"]
-            
-            if intent in valid_intents:
-                return intent
-            
         except Exception as e:
-            logger.debug(f"AI intent classification failed for '{keyword}': {str(e)}")
-        
-        # Smart fallback classification
-        return self._classify_intent_smart(keyword)
-    
+            logger.warning(f"Batch intent classification failed: {str(e)}")
+            return [self._classify_intent_smart(kw) for kw in keywords]
+
+
     def _classify_intent_smart(self, keyword: str) -> str:
         """Smart intent classification based on keyword patterns"""
-        
-        keyword_lower = keyword.lower()
-        
+
+        mask = _term_mask(keyword.lower())
+
         # Transactional signals
-        transactional = ["buy", "purchase", "order", "apply", "signup", "register", "get", "download"]
-        if any(word in keyword_lower for word in transactional):
+        if mask & _F_TRANSACTIONAL:
             return "transactional"
-        
+
         # Commercial signals
-        commercial = ["best", "top", "review", "compare", "vs", "price", "cost", "deal"]
-        if any(word in keyword_lower for word in commercial):
+        if mask & _F_COMMERCIAL:
             return "commercial"
-        
+
         # Informational signals
-        informational = ["how to", "what is", "why", "when", "guide", "tips", "learn", "tutorial"]
-        if any(word in keyword_lower for word in informational):
+        if mask & _F_INFORMATIONAL:
             return "informational"
-        
+
         # Navigational signals
-        navigational = ["login", "website", "official", "homepage"]
-        if any(word in keyword_lower for word in navigational):
+        if mask & _F_NAVIGATIONAL:
             return "navigational"
-        
+
         # Default based on keyword characteristics
-        if len(keyword.split()) >= 3:
+        if keyword.count(' ') >= 2:
             return "informational"  # Long-tail tends to be informational
         else:
             return "commercial"  # Short terms tend to be commercial
     
-    def _estimate_cpc(self, keyword: str) -> float:
-        """Estimate cost per click based on keyword characteristics"""
-        
-        keyword_lower = keyword.lower()
-        base_cpc = 1.50
-        
-        # High-value industries
-        if any(term in keyword_lower for term in ["insurance", "lawyer", "loan", "mortgage"]):
-            base_cpc *= 15.0
-        elif any(term in keyword_lower for term in ["software", "course", "training"]):
-            base_cpc *= 5.0
-        elif any(term in keyword_lower for term in ["buy", "purchase", "price"]):
-            base_cpc *= 3.0
-        elif any(term in keyword_lower for term in ["best", "top", "review"]):
-            base_cpc *= 2.0
-        
-        # Long-tail keywords have lower CPC
-        word_count = len(keyword.split())
-        if word_count >= 4:
-            base_cpc *= 0.6
-        elif word_count >= 3:
-            base_cpc *= 0.8
-        
-        return round(max(0.25, min(50.0, base_cpc)), 2)
-    
-    def _calculate_opportunity_score(self, search_volume: int, competition: float, 
-                                   difficulty: int, intent: str) -> float:
-        """Calculate opportunity score (0-100) - PROFESSIONAL ALGORITHM"""
-        
-        # Volume component (35% weight)
-        volume_normalized = min(100, search_volume / 50)  # Normalize to 0-100
-        volume_score = volume_normalized * 0.35
-        
-        # Competition component (35% weight) - lower is better
-        competition_score = (1 - competition) * 35
-        
-        # Difficulty component (20% weight) - lower is better
-        difficulty_score = ((100 - difficulty) / 100) * 20
-        
-        # Intent bonus (10% weight)
-        intent_weights = {
-            "transactional": 10,
-            "commercial": 8,
-            "informational": 6,
-            "navigational": 4
-        }
-        intent_score = intent_weights.get(intent, 6)
-        
-        total_score = volume_score + competition_score + difficulty_score + intent_score
-        
-        return max(0, min(100, total_score))
-    
-    def _calculate_ranking_probability(self, difficulty: int) -> float:
-        """Calculate realistic first-page ranking probability"""
-        
-        if difficulty <= 20:
-            return 0.85  # Very easy
-        elif difficulty <= 35:
-            return 0.70  # Easy
-        elif difficulty <= 50:
-            return 0.50  # Medium
-        elif difficulty <= 65:
-            return 0.30  # Hard
-        elif difficulty <= 80:
-            return 0.15  # Very hard
-        else:
-            return 0.05  # Extremely hard
-    
     def _rank_by_opportunity(self, keyword_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Rank keywords by opportunity score with secondary sorting"""
-        
-        return sorted(keyword_data, key=lambda x: (
-            x["opportunity_score"],      # Primary: opportunity score
-            x["search_volume"],          # Secondary: search volume
-            -x["difficulty"]             # Tertiary: lower difficulty
-        ), reverse=True)
+
+        if not keyword_data:
+            return []
+
+        # One lexsort over column arrays beats tuple comparisons through
+        # sorted() once batch aggregation reaches thousands of rows.
+        # Last key is primary: opportunity desc, then volume desc, then
+        # difficulty asc.
+        opp = np.array([kw["opportunity_score"] for kw in keyword_data])
+        vol = np.array([kw["search_volume"] for kw in keyword_data])
+        diff = np.array([kw["difficulty"] for kw in keyword_data])
+        order = np.lexsort((diff, -vol, -opp))
+        return [keyword_data[i] for i in order]
     
-    def export_to_csv(self, results: Dict[str, Any]) -> str:
-        """Export results to CSV format"""
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Headers
-        headers = [
-            "Keyword", "Opportunity Score", "Search Volume", "Competition Score", 
-            "Difficulty", "Intent", "CPC Estimate", "Ranking Probability",
-            "Word Count"
-        ]
-        writer.writerow(headers)
-        
-        # Data rows
-        for kw in results["keywords"]:
-            writer.writerow([
-                kw["keyword"],
-                kw["opportunity_score"],
-                kw["search_volume"],
-                kw["competition_score"],
-                kw["difficulty"],
-                kw["intent"],
-                kw["cpc_estimate"],
-                kw["ranking_probability"],
-                kw["word_count"]
-            ])
-        
-        return output.getvalue()
+    # Column order for CSV export; itemgetter pulls all fields per row in one call
+    _CSV_HEADERS = [
+        "Keyword", "Opportunity Score", "Search Volume", "Competition Score",
+        "Difficulty", "Intent", "CPC Estimate", "Ranking Probability",
+        "Word Count"
+    ]
+    _CSV_ROW = operator.itemgetter(
+        "keyword", "opportunity_score", "search_volume", "competition_score",
+        "difficulty", "intent", "cpc_estimate", "ranking_probability",
+        "word_count"
+    )
+
+    def export_to_csv(self, results: Dict[str, Any], dest=None) -> str:
+        """Export results to CSV format
+
+        With dest=None, returns the CSV as a string (original behaviour).
+        Pass a file path or an open text file to stream rows straight to it
+        instead of building the whole document in memory first.
+        """
+        if dest is None:
+            output = io.StringIO()
+            self._write_csv(output, results)
+            return output.getvalue()
+
+        if isinstance(dest, str):
+            with open(dest, 'w', newline='', encoding='utf-8') as f:
+                self._write_csv(f, results)
+            return dest
+
+        self._write_csv(dest, results)
+        return ""
+
+    def _write_csv(self, fileobj, results: Dict[str, Any]) -> None:
+        writer = csv.writer(fileobj)
+        writer.writerow(self._CSV_HEADERS)
+        writer.writerows(map(self._CSV_ROW, results["keywords"]))
     
     def export_to_json(self, results: Dict[str, Any]) -> str:
         """Export results to JSON format"""
-        return json.dumps(results, indent=2, default=str)
+        return _dumps(results)
     
     async def batch_research(self, seed_keywords: List[str], max_keywords_each: int = 25,
                            country: str = "US") -> Dict[str, Dict[str, Any]]:
-        """Research multiple seed keywords in batch"""
-        
+        """Research multiple seed keywords concurrently"""
+
         logger.info(f"Starting batch research for {len(seed_keywords)} keywords")
         start_time = time.time()
-        
-        results = {}
-        
-        # Process each seed keyword
-        for i, seed_keyword in enumerate(seed_keywords, 1):
-            logger.info(f"[{i}/{len(seed_keywords)}] Processing: {seed_keyword}")
-            
-            try:
-                result = await self.research_keywords(
-                    seed_keyword=seed_keyword,
-                    max_keywords=max_keywords_each,
-                    country=country
-                )
-                results[seed_keyword] = result
-                
-            except Exception as e:
-                logger.error(f"Error processing '{seed_keyword}': {str(e)}")
-                results[seed_keyword] = {
-                    "error": str(e),
-                    "seed_keyword": seed_keyword,
-                    "total_keywords": 0,
-                    "keywords": []
-                }
-            
-            # Small delay between requests
-            await asyncio.sleep(1)
-        
+
+        # Seeds run concurrently; the AIMD controller and rate limiters
+        # already gate the underlying API calls, the semaphore just keeps
+        # the number of in-flight research pipelines bounded
+        sem = asyncio.Semaphore(self._seed_concurrency)
+
+        async def _research_one(seed_keyword: str) -> Dict[str, Any]:
+            async with sem:
+                logger.info(f"Processing: {seed_keyword}")
+                try:
+                    return await self.research_keywords(
+                        seed_keyword=seed_keyword,
+                        max_keywords=max_keywords_each,
+                        country=country
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing '{seed_keyword}': {str(e)}")
+                    return {
+                        "error": str(e),
+                        "seed_keyword": seed_keyword,
+                        "total_keywords": 0,
+                        "keywords": []
+                    }
+
+        batch_results = await asyncio.gather(*(_research_one(s) for s in seed_keywords))
+        results = dict(zip(seed_keywords, batch_results))
+
         total_time = time.time() - start_time
         logger.info(f"Batch research complete in {total_time:.1f}s")
-        
+
         return results
     
     async def close(self):
         """Clean up resources"""
-        await self.openai_client.close()
-        self.executor.shutdown(wait=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._owns_http_client:
+            await self.openai_client.close()
 
 
 # CLI Interface
@@ -726,10 +1128,8 @@ async def single_keyword_research(agent: ProductionSEOAgent):
         # Export options
         export = input("\nExport results? (csv/json/no): ").strip().lower()
         if export == "csv":
-            csv_data = agent.export_to_csv(result)
             filename = f"keywords_{seed_keyword.replace(' ', '_')}.csv"
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                f.write(csv_data)
+            agent.export_to_csv(result, filename)
             print(f"Exported to {filename}")
         elif export == "json":
             json_data = agent.export_to_json(result)
@@ -775,8 +1175,8 @@ async def batch_keyword_research(agent: ProductionSEOAgent):
         # Export batch results
         export = input("\nExport batch results? (json/no): ").strip().lower()
         if export == "json":
-            json_data = json.dumps(results, indent=2, default=str)
-            filename = f"batch_keywords_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            json_data = _dumps(results)
+            filename = f"batch_keywords_{time.time_ns()}.json"
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(json_data)
             print(f"Batch results exported to {filename}")
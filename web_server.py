@@ -6,29 +6,60 @@ FastAPI Web Server for SEO Keyword Research AI Agent
 - Production ready
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import Dict, List, Optional
+from collections import OrderedDict
 import asyncio
+import hashlib
+import os
+import time
 import json
 import io
 import csv
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _json_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    orjson = None
+
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+import numpy as np
+import httpx
+
 from seo_agent_pro import ProductionSEOAgent
 
-# Pydantic models
+# Pydantic models — frozen so instances are hashable and immutable once
+# validated; whitespace stripping + the lowering validator normalize the
+# seed up front so equivalent requests hit the same cache entries
 class KeywordRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     seed_keyword: str
     max_keywords: int = 50
     country: str = "US"
     include_questions: bool = True
     include_long_tail: bool = True
+    no_cache: bool = False
+
+    @field_validator("seed_keyword")
+    @classmethod
+    def _normalize_seed(cls, v: str) -> str:
+        return v.lower()
 
 class BatchRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     seed_keywords: List[str]
     max_keywords_each: int = 25
     country: str = "US"
@@ -37,53 +68,343 @@ class BatchRequest(BaseModel):
 app = FastAPI(
     title="SEO Keyword Research AI Agent",
     description="Production-grade AI-powered keyword research tool",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the large keyword payloads several times faster
+    # than the stdlib encoder behind the default JSONResponse
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
 )
 
-# Add CORS middleware
+# CORS: explicit allowlist (wildcard + credentials is a footgun) and a 24h
+# preflight cache so browsers skip the OPTIONS round-trip on repeat calls.
+# Same-origin use of the bundled UI never needs CORS at all.
+CORS_ORIGINS = [
+    o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:8000").split(",") if o.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
+# Compress anything above 500 bytes — the index page and keyword payloads
+# shrink ~80% on the wire
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Initialize SEO agent
 seo_agent = None
 
+# How many research pipelines /api/batch-research runs in flight at once;
+# per-call pacing below this is the agent's AIMD controller + rate limiters
+BATCH_CONCURRENCY = 8
+
+# Exact-match response cache: identical research requests skip the whole
+# pipeline and replay pre-serialized JSON bytes
+RESEARCH_CACHE_MAX_SIZE = 1024
+
+# Singleflight: identical requests that arrive while the pipeline is
+# already running for that key await the in-flight future instead of
+# launching duplicate OpenAI work
+_inflight: Dict[tuple, asyncio.Future] = {}
+_research_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_research_cache_lock = asyncio.Lock()
+
+
+# CSV bytes memoized by a hash of the result they were rendered from, so
+# repeat downloads of the same result set skip row formatting entirely
+CSV_CACHE_MAX_SIZE = 256
+_csv_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_csv_cache_lock = asyncio.Lock()
+
+
+def _result_hash(result: dict) -> str:
+    if orjson is not None:
+        payload = orjson.dumps(result, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(result, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _research_cache_key(request: KeywordRequest) -> tuple:
+    return (request.seed_keyword.lower().strip(), request.max_keywords,
+            request.country, request.include_questions, request.include_long_tail)
+
+
+def _prompt_cache_key(request: KeywordRequest) -> str:
+    """Server-side prompt cache hint: requests sharing the same static
+    prompt scaffolding land on the same OpenAI cache shard"""
+    return f"seo:{request.country}:{int(request.include_questions)}:{int(request.include_long_tail)}"
+
+
+def _request_etag(request: KeywordRequest) -> str:
+    """ETag derived from the canonicalized request body"""
+    if orjson is not None:
+        payload = orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(request.model_dump(), sort_keys=True).encode()
+    return f'"{hashlib.sha256(payload).hexdigest()[:16]}"'
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent embedding calls into single batched requests
+
+    Each lookup parks a future on a queue; a worker drains the queue every
+    ~15ms (up to 64 texts) and issues one embeddings.create for the whole
+    batch, amortizing the HTTP round-trip across bursty traffic.
+    """
+
+    WINDOW = 0.015  # seconds the worker waits to fill a batch
+    MAX_BATCH = 64
+
+    def __init__(self, model: str = "text-embedding-3-small"):
+        self.model = model
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> Optional[np.ndarray]:
+        """Return a unit-norm embedding, or None if the API call failed"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.WINDOW
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                response = await seo_agent.openai_client.embeddings.create(
+                    model=self.model,
+                    input=[text for text, _ in batch]
+                )
+                for (_, future), item in zip(batch, response.data):
+                    if not future.done():
+                        vec = np.asarray(item.embedding, dtype=np.float32)
+                        future.set_result(vec / np.linalg.norm(vec))
+            except Exception:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+
+_embedding_batcher = EmbeddingBatcher()
+
+
+class SemanticCache:
+    """Semantic cache: near-duplicate seeds reuse the full pipeline result
+
+    Lexical variants of a seed ("digital marketing tools" vs "tools for
+    digital marketing") embed almost identically, so one cheap embedding
+    call replaces the whole GPT pipeline when a stored seed with the same
+    option fields is cosine-similar enough. Held in-process with a linear
+    scan — fine at a few hundred entries; a Redis/HNSW index is the upgrade
+    path if the cache needs to be shared across workers.
+    """
+
+    SIMILARITY_THRESHOLD = 0.97
+    TTL = 6 * 3600  # 6 hours
+    MAX_SIZE = 512
+
+    def __init__(self):
+        # (params tuple, unit-norm embedding, response bytes, timestamp)
+        self._entries: list = []
+        self._lock = asyncio.Lock()
+
+    async def _embed(self, seed: str) -> Optional[np.ndarray]:
+        try:
+            return await _embedding_batcher.embed(seed)
+        except Exception:
+            return None
+
+    async def lookup(self, seed: str, params: tuple):
+        """Return (cached bytes or None, seed embedding for a later store)"""
+        vec = await self._embed(seed)
+        if vec is None:
+            return None, None
+
+        now = datetime.now().timestamp()
+        async with self._lock:
+            self._entries = [e for e in self._entries if now - e[3] < self.TTL]
+            best = None
+            best_sim = self.SIMILARITY_THRESHOLD
+            for entry in self._entries:
+                if entry[0] != params:
+                    continue
+                sim = float(np.dot(entry[1], vec))
+                if sim >= best_sim:
+                    best_sim = sim
+                    best = entry
+            return (best[2] if best is not None else None), vec
+
+    async def store(self, vec: Optional[np.ndarray], params: tuple, body: bytes) -> None:
+        if vec is None:
+            return
+        async with self._lock:
+            self._entries.append((params, vec, body, datetime.now().timestamp()))
+            if len(self._entries) > self.MAX_SIZE:
+                self._entries.pop(0)
+
+
+_semantic_cache = SemanticCache()
+
 @app.on_event("startup")
 async def startup_event():
     global seo_agent
-    seo_agent = ProductionSEOAgent()
+    # One pooled HTTP client for the whole process: OpenAI traffic from every
+    # endpoint reuses warm connections instead of paying TCP+TLS per request
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=30
+    )
+    seo_agent = ProductionSEOAgent(http_client=app.state.http,
+                                   seed_concurrency=BATCH_CONCURRENCY)
+    # Warm the process off the request path: a throwaway research run
+    # compiles the regex/scoring machinery, primes numpy, and opens the
+    # first TLS connection to OpenAI so the first real request doesn't
+    # pay any of those costs. Failures (e.g. missing API key) are
+    # non-fatal -- the server still comes up.
+    asyncio.ensure_future(_warmup(seo_agent))
+
+async def _warmup(agent):
+    try:
+        await agent.research_keywords(
+            seed_keyword="warmup",
+            max_keywords=1,
+            country="US",
+            include_questions=False,
+            include_long_tail=False,
+            prompt_cache_key="seo:warmup"
+        )
+    except Exception:
+        pass
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await _embedding_batcher.close()
     if seo_agent:
         await seo_agent.close()
+    await app.state.http.aclose()
 
 # API Endpoints
-@app.post("/api/research")
-async def research_keywords(request: KeywordRequest):
+@app.post("/api/research", response_model=None)
+async def research_keywords(request: KeywordRequest, http_request: Request = None):
     """Research keywords endpoint"""
     
     if not seo_agent:
         raise HTTPException(status_code=500, detail="SEO agent not initialized")
-    
+
+    cache_key = _research_cache_key(request)
+    etag = _request_etag(request)
+    seed_vec = None
+    if not request.no_cache:
+        async with _research_cache_lock:
+            cached = _research_cache.get(cache_key)
+            if cached is not None:
+                _research_cache.move_to_end(cache_key)
+                # Client already holds this exact result: zero-byte reply
+                if http_request is not None and http_request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers={"ETag": etag})
+                return Response(content=cached, media_type="application/json",
+                                headers={"ETag": etag})
+
+        # Exact miss — try near-duplicate seeds with the same options
+        semantic_hit, seed_vec = await _semantic_cache.lookup(cache_key[0], cache_key[1:])
+        if semantic_hit is not None:
+            return Response(content=semantic_hit, media_type="application/json")
+
+        # Coalesce with any identical request already in flight
+        pending = _inflight.get(cache_key)
+        if pending is not None:
+            try:
+                body = await asyncio.shield(pending)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+            return Response(content=body, media_type="application/json",
+                            headers={"ETag": etag})
+
+    flight = None
+    if not request.no_cache:
+        flight = asyncio.get_running_loop().create_future()
+        _inflight[cache_key] = flight
+
     try:
         result = await seo_agent.research_keywords(
             seed_keyword=request.seed_keyword,
             max_keywords=request.max_keywords,
             country=request.country,
             include_questions=request.include_questions,
-            include_long_tail=request.include_long_tail
+            include_long_tail=request.include_long_tail,
+            prompt_cache_key=_prompt_cache_key(request)
         )
-        return result
-        
+
+        # Serialize once; cache the bytes so repeats skip both the pipeline
+        # and re-serialization
+        body = _json_bytes(result)
+        if flight is not None:
+            flight.set_result(body)
+        if not request.no_cache:
+            async with _research_cache_lock:
+                _research_cache[cache_key] = body
+                if len(_research_cache) > RESEARCH_CACHE_MAX_SIZE:
+                    _research_cache.popitem(last=False)
+            await _semantic_cache.store(seed_vec, cache_key[1:], body)
+        return Response(content=body, media_type="application/json",
+                        headers={"ETag": etag})
+
     except Exception as e:
+        if flight is not None and not flight.done():
+            flight.set_exception(e)
+            # Waiters consume the exception; suppress "never retrieved"
+            flight.exception()
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if flight is not None:
+            _inflight.pop(cache_key, None)
 
-@app.post("/api/batch-research")
+@app.post("/api/research/stream")
+async def research_keywords_stream(request: KeywordRequest):
+    """Stream scored keywords as Server-Sent Events"""
+
+    if not seo_agent:
+        raise HTTPException(status_code=500, detail="SEO agent not initialized")
+
+    async def event_stream():
+        try:
+            async for keyword_data in seo_agent.research_keywords_stream(
+                seed_keyword=request.seed_keyword,
+                max_keywords=request.max_keywords,
+                country=request.country,
+                include_questions=request.include_questions,
+                include_long_tail=request.include_long_tail,
+                prompt_cache_key=_prompt_cache_key(request)
+            ):
+                yield f"data: {_json_bytes(keyword_data).decode()}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {_json_bytes({'detail': str(e)}).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.post("/api/batch-research", response_model=None)
 async def batch_research(request: BatchRequest):
     """Batch research keywords endpoint"""
     
@@ -96,7 +417,11 @@ async def batch_research(request: BatchRequest):
             max_keywords_each=request.max_keywords_each,
             country=request.country
         )
-        return results
+        # Returning the response object directly skips FastAPI's
+        # jsonable_encoder walk over every nested keyword dict
+        if orjson is not None:
+            return ORJSONResponse(results)
+        return JSONResponse(results)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -109,455 +434,140 @@ async def export_csv(request: KeywordRequest):
         raise HTTPException(status_code=500, detail="SEO agent not initialized")
     
     try:
-        # Get research results
-        result = await seo_agent.research_keywords(
-            seed_keyword=request.seed_keyword,
-            max_keywords=request.max_keywords,
-            country=request.country,
-            include_questions=request.include_questions,
-            include_long_tail=request.include_long_tail
-        )
-        
-        # Generate CSV
-        csv_data = seo_agent.export_to_csv(result)
-        
-        # Return as streaming response
-        output = io.StringIO(csv_data)
-        
-        return StreamingResponse(
-            io.BytesIO(csv_data.encode('utf-8')),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename=keywords_{request.seed_keyword.replace(' ', '_')}.csv"}
-        )
+        # Reuse the research cache: exporting right after researching the
+        # same request must not re-run the pipeline
+        cache_key = _research_cache_key(request)
+        result = None
+        if not request.no_cache:
+            async with _research_cache_lock:
+                cached = _research_cache.get(cache_key)
+                if cached is not None:
+                    _research_cache.move_to_end(cache_key)
+                    result = orjson.loads(cached) if orjson is not None else json.loads(cached)
+
+        if result is None:
+            result = await seo_agent.research_keywords(
+                seed_keyword=request.seed_keyword,
+                max_keywords=request.max_keywords,
+                country=request.country,
+                include_questions=request.include_questions,
+                include_long_tail=request.include_long_tail
+            )
+            if not request.no_cache:
+                async with _research_cache_lock:
+                    _research_cache[cache_key] = _json_bytes(result)
+                    if len(_research_cache) > RESEARCH_CACHE_MAX_SIZE:
+                        _research_cache.popitem(last=False)
+
+        # time_ns keeps repeat downloads distinct without the tzinfo/strftime
+        # allocations of datetime.now()
+        filename = f"keywords_{request.seed_keyword.replace(' ', '_')}_{time.time_ns()}.csv"
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
+
+        result_key = _result_hash(result)
+        async with _csv_cache_lock:
+            csv_bytes = _csv_cache.get(result_key)
+            if csv_bytes is not None:
+                _csv_cache.move_to_end(result_key)
+
+        if csv_bytes is None:
+            csv_bytes = b''.join(_iter_csv(result))
+            async with _csv_cache_lock:
+                _csv_cache[result_key] = csv_bytes
+                if len(_csv_cache) > CSV_CACHE_MAX_SIZE:
+                    _csv_cache.popitem(last=False)
+
+        return Response(csv_bytes, media_type="text/csv", headers=headers)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+def _iter_csv(result: dict, chunk_size: int = 64 * 1024):
+    """Yield CSV bytes in bounded chunks instead of one in-memory blob"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(ProductionSEOAgent._CSV_HEADERS)
+    for kw in result["keywords"]:
+        writer.writerow(ProductionSEOAgent._CSV_ROW(kw))
+        if buf.tell() >= chunk_size:
+            yield buf.getvalue().encode('utf-8')
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue().encode('utf-8')
+
+# Probes hit /api/health every few seconds; serve constant bytes with no
+# per-call dict building or timestamp formatting
+_HEALTH_OK = b'{"status":"healthy"}'
+_HEALTH_UNAVAILABLE = b'{"status":"unavailable"}'
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
+    if seo_agent is not None:
+        return Response(content=_HEALTH_OK, media_type="application/json")
+    return Response(content=_HEALTH_UNAVAILABLE, media_type="application/json", status_code=503)
+
+
+@app.get("/api/status")
+async def status():
+    """Detailed status for humans/dashboards (not for high-frequency probes)"""
     return {
-        "status": "healthy",
+        "status": "healthy" if seo_agent is not None else "unavailable",
         "timestamp": datetime.now().isoformat(),
         "agent_initialized": seo_agent is not None
     }
 
-# Web Interface
-@app.get("/", response_class=HTMLResponse)
-async def read_root():
-    """Serve the main web interface"""
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SEO Keyword Research AI Agent</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-        body { 
-            font-family: 'Inter', sans-serif;
-            background-color: #000000;
-            color: #ffffff;
-        }
-        
-        .dark-bg {
-            background-color: #000000;
-        }
-        
-        .keyword-card {
-            transition: all 0.3s ease;
-            border-left: 4px solid #ffffff;
-            background-color: #111111;
-            border: 1px solid #333333;
-        }
-        
-        .keyword-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(255,255,255,0.1);
-            background-color: #1a1a1a;
-        }
-        
-        .loading {
-            border: 3px solid #333333;
-            border-top: 3px solid #ffffff;
-            border-radius: 50%;
-            width: 30px;
-            height: 30px;
-            animation: spin 1s linear infinite;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        .badge {
-            padding: 0.25rem 0.75rem;
-            border-radius: 9999px;
-            font-size: 0.75rem;
-            font-weight: 500;
-        }
-        
-        .badge-high { background-color: #333333; color: #ffffff; border: 1px solid #666666; }
-        .badge-medium { background-color: #666666; color: #ffffff; }
-        .badge-low { background-color: #999999; color: #000000; }
-        
-        input, select {
-            background-color: #111111;
-            border-color: #333333;
-            color: #ffffff;
-        }
-        
-        input:focus, select:focus {
-            border-color: #ffffff;
-            box-shadow: 0 0 0 2px rgba(255,255,255,0.2);
-        }
-        
-        .btn-primary {
-            background-color: #ffffff;
-            color: #000000;
-        }
-        
-        .btn-primary:hover {
-            background-color: #cccccc;
-        }
-        
-        .btn-secondary {
-            background-color: #333333;
-            color: #ffffff;
-            border: 1px solid #666666;
-        }
-        
-        .btn-secondary:hover {
-            background-color: #555555;
-        }
-    </style>
-</head>
-<body class="bg-black text-white">
-    <!-- Header -->
-    <header class="dark-bg border-b border-gray-800">
-        <div class="container mx-auto px-6 py-8">
-            <h1 class="text-4xl font-bold mb-2 text-white">SEO Keyword Research AI Agent</h1>
-            <p class="text-xl text-gray-300">Production-grade AI-powered keyword research platform</p>
-        </div>
-    </header>
-
-    <!-- Main Content -->
-    <main class="container mx-auto px-6 py-8">
-        <!-- Research Form -->
-        <div class="bg-gray-900 rounded-lg border border-gray-700 p-8 mb-8">
-            <h2 class="text-2xl font-semibold mb-6 text-white">Keyword Research</h2>
-            
-            <form id="keywordForm" class="space-y-6">
-                <div class="grid md:grid-cols-2 gap-6">
-                    <div>
-                        <label for="seedKeyword" class="block text-sm font-medium text-gray-300 mb-2">Seed Keyword *</label>
-                        <input type="text" id="seedKeyword" name="seedKeyword" required
-                               class="w-full px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-white focus:border-white"
-                               placeholder="e.g., digital marketing">
-                    </div>
-                    
-                    <div>
-                        <label for="maxKeywords" class="block text-sm font-medium text-gray-300 mb-2">Max Keywords</label>
-                        <select id="maxKeywords" name="maxKeywords" 
-                                class="w-full px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-white focus:border-white">
-                            <option value="25">25 keywords</option>
-                            <option value="50" selected>50 keywords</option>
-                            <option value="75">75 keywords</option>
-                            <option value="100">100 keywords</option>
-                        </select>
-                    </div>
-                </div>
-                
-                <div class="grid md:grid-cols-3 gap-4">
-                    <div>
-                        <label for="country" class="block text-sm font-medium text-gray-300 mb-2">Target Country</label>
-                        <select id="country" name="country" 
-                                class="w-full px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-white focus:border-white">
-                            <option value="US" selected>United States</option>
-                            <option value="GB">United Kingdom</option>
-                            <option value="CA">Canada</option>
-                            <option value="AU">Australia</option>
-                            <option value="IN">India</option>
-                        </select>
-                    </div>
-                    
-                    <div class="flex items-center">
-                        <input type="checkbox" id="includeQuestions" name="includeQuestions" checked 
-                               class="rounded border-gray-600 bg-gray-800 text-white">
-                        <label for="includeQuestions" class="ml-2 text-sm font-medium text-gray-300">Include Questions</label>
-                    </div>
-                    
-                    <div class="flex items-center">
-                        <input type="checkbox" id="includeLongTail" name="includeLongTail" checked 
-                               class="rounded border-gray-600 bg-gray-800 text-white">
-                        <label for="includeLongTail" class="ml-2 text-sm font-medium text-gray-300">Include Long-tail</label>
-                    </div>
-                </div>
-                
-                <div class="flex gap-4">
-                    <button type="submit" id="researchBtn" 
-                            class="btn-primary font-semibold py-3 px-8 rounded-lg transition duration-300">
-                        Research Keywords
-                    </button>
-                    
-                    <button type="button" id="exportCsvBtn" 
-                            class="btn-secondary font-semibold py-3 px-8 rounded-lg transition duration-300"
-                            disabled>
-                        Export CSV
-                    </button>
-                </div>
-            </form>
-        </div>
-
-        <!-- Loading State -->
-        <div id="loadingState" class="hidden bg-gray-900 rounded-lg border border-gray-700 p-8 mb-8">
-            <div class="flex items-center justify-center space-x-4">
-                <div class="loading"></div>
-                <div>
-                    <p class="text-lg font-semibold text-white">AI is researching keywords...</p>
-                    <p class="text-gray-300">Using real OpenAI GPT-4 and advanced SEO metrics</p>
-                </div>
-            </div>
-        </div>
-
-        <!-- Results Section -->
-        <div id="resultsSection" class="hidden">
-            <!-- Summary Stats -->
-            <div id="summaryStats" class="grid md:grid-cols-4 gap-4 mb-8">
-                <!-- Stats will be populated here -->
-            </div>
-
-            <!-- Keywords List -->
-            <div class="bg-gray-900 rounded-lg border border-gray-700">
-                <div class="px-6 py-4 bg-gray-800 border-b border-gray-700">
-                    <h3 class="text-lg font-semibold text-white">Keyword Opportunities</h3>
-                </div>
-                
-                <div id="keywordsList" class="p-6">
-                    <!-- Keywords will be populated here -->
-                </div>
-            </div>
-        </div>
-
-        <!-- Error State -->
-        <div id="errorState" class="hidden bg-gray-900 border border-gray-600 rounded-lg p-6 mb-8">
-            <div class="flex items-center space-x-3">
-                <div class="text-gray-400 text-xl">!</div>
-                <div>
-                    <h3 class="text-lg font-semibold text-white">Error</h3>
-                    <p id="errorMessage" class="text-gray-300"></p>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <script>
-        let currentResults = null;
-
-        document.getElementById('keywordForm').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            
-            const formData = new FormData(e.target);
-            const requestData = {
-                seed_keyword: formData.get('seedKeyword'),
-                max_keywords: parseInt(formData.get('maxKeywords')),
-                country: formData.get('country'),
-                include_questions: formData.has('includeQuestions'),
-                include_long_tail: formData.has('includeLongTail')
-            };
-
-            await researchKeywords(requestData);
-        });
-
-        document.getElementById('exportCsvBtn').addEventListener('click', async () => {
-            if (currentResults) {
-                await exportToCsv(currentResults);
-            }
-        });
-
-        async function researchKeywords(requestData) {
-            try {
-                showLoading();
-                hideError();
-                
-                const response = await fetch('/api/research', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify(requestData)
-                });
-
-                if (!response.ok) {
-                    throw new Error(`HTTP ${response.status}: ${await response.text()}`);
-                }
-
-                const data = await response.json();
-                currentResults = data;
-                displayResults(data);
-                
-            } catch (error) {
-                console.error('Error:', error);
-                showError(error.message);
-            } finally {
-                hideLoading();
-            }
-        }
-
-        async function exportToCsv(results) {
-            try {
-                const requestData = {
-                    seed_keyword: results.seed_keyword,
-                    max_keywords: results.total_keywords,
-                    country: results.country || "US",
-                    include_questions: true,
-                    include_long_tail: true
-                };
-
-                const response = await fetch('/api/export/csv', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify(requestData)
-                });
-
-                if (response.ok) {
-                    const blob = await response.blob();
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = `keywords_${results.seed_keyword.replace(' ', '_')}.csv`;
-                    document.body.appendChild(a);
-                    a.click();
-                    window.URL.revokeObjectURL(url);
-                    document.body.removeChild(a);
-                } else {
-                    throw new Error('Export failed');
-                }
-            } catch (error) {
-                alert('Export failed: ' + error.message);
-            }
-        }
-
-        function showLoading() {
-            document.getElementById('loadingState').classList.remove('hidden');
-            document.getElementById('resultsSection').classList.add('hidden');
-            document.getElementById('researchBtn').disabled = true;
-            document.getElementById('exportCsvBtn').disabled = true;
-        }
-
-        function hideLoading() {
-            document.getElementById('loadingState').classList.add('hidden');
-            document.getElementById('researchBtn').disabled = false;
-        }
-
-        function showError(message) {
-            document.getElementById('errorMessage').textContent = message;
-            document.getElementById('errorState').classList.remove('hidden');
-            document.getElementById('resultsSection').classList.add('hidden');
-        }
-
-        function hideError() {
-            document.getElementById('errorState').classList.add('hidden');
-        }
-
-        function displayResults(data) {
-            displaySummaryStats(data);
-            displayKeywords(data.keywords);
-            document.getElementById('resultsSection').classList.remove('hidden');
-            document.getElementById('exportCsvBtn').disabled = false;
-        }
-
-        function displaySummaryStats(data) {
-            const stats = [
-                {
-                    title: 'Total Keywords',
-                    value: data.total_keywords
-                },
-                {
-                    title: 'Processing Time',
-                    value: `${data.processing_time}s`
-                },
-                {
-                    title: 'API Calls',
-                    value: data.metadata?.api_calls || 0
-                },
-                {
-                    title: 'Avg Opportunity',
-                    value: Math.round(data.keywords.reduce((sum, k) => sum + k.opportunity_score, 0) / data.keywords.length)
-                }
-            ];
-
-            const statsHTML = stats.map(stat => `
-                <div class="bg-gray-900 rounded-lg border border-gray-700 p-6 text-center">
-                    <div class="text-2xl font-bold text-white">${stat.value}</div>
-                    <div class="text-sm text-gray-300">${stat.title}</div>
-                </div>
-            `).join('');
-
-            document.getElementById('summaryStats').innerHTML = statsHTML;
-        }
-
-        function displayKeywords(keywords) {
-            const keywordsHTML = keywords.map((keyword, index) => {
-                const difficultyClass = keyword.difficulty <= 30 ? 'badge-low' : 
-                                      keyword.difficulty <= 60 ? 'badge-medium' : 'badge-high';
-                const difficultyText = keyword.difficulty <= 30 ? 'Easy' : 
-                                     keyword.difficulty <= 60 ? 'Medium' : 'Hard';
-                
-                return `
-                    <div class="keyword-card p-4 mb-4">
-                        <div class="flex items-center justify-between mb-3">
-                            <h4 class="text-lg font-semibold text-white">${keyword.keyword}</h4>
-                            <div class="flex items-center space-x-2">
-                                <span class="text-2xl font-bold text-white">${keyword.opportunity_score}</span>
-                                <span class="text-sm text-gray-400">score</span>
-                            </div>
-                        </div>
-                        
-                        <div class="grid md:grid-cols-4 gap-4 text-sm">
-                            <div>
-                                <span class="text-gray-400">Search Volume</span>
-                                <div class="font-semibold text-gray-200">${keyword.search_volume.toLocaleString()}</div>
-                            </div>
-                            <div>
-                                <span class="text-gray-400">Difficulty</span>
-                                <div class="flex items-center space-x-2">
-                                    <span class="badge ${difficultyClass}">${difficultyText}</span>
-                                    <span class="text-gray-400">${keyword.difficulty}/100</span>
-                                </div>
-                            </div>
-                            <div>
-                                <span class="text-gray-400">Intent</span>
-                                <div class="font-semibold text-gray-200 capitalize">${keyword.intent}</div>
-                            </div>
-                            <div>
-                                <span class="text-gray-400">CPC Estimate</span>
-                                <div class="font-semibold text-gray-200">$${keyword.cpc_estimate}</div>
-                            </div>
-                        </div>
-                        
-                        <div class="mt-3 pt-3 border-t border-gray-700">
-                            <div class="flex items-center justify-between text-sm">
-                                <span class="text-gray-400">Ranking Probability: <strong class="text-gray-200">${Math.round(keyword.ranking_probability * 100)}%</strong></span>
-                                <span class="text-gray-400">Competition: <strong class="text-gray-200">${keyword.competition_score}</strong></span>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }).join('');
-
-            document.getElementById('keywordsList').innerHTML = keywordsHTML;
-        }
-    </script>
-</body>
-</html>
-    """
+# Web Interface: static/index.html is read into memory once at import so
+# GET / returns preencoded bytes — no disk I/O or UTF-8 encoding per
+# request. Other static assets still go through the StaticFiles mount.
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+_INDEX_PATH = os.path.join(_STATIC_DIR, "index.html")
+with open(_INDEX_PATH, 'rb') as _f:
+    _INDEX_BYTES = _f.read()
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_BYTES).hexdigest()}"'
+
+
+@app.get("/", include_in_schema=False)
+async def read_root(request: Request):
+    """Serve the main web interface from the preloaded bytes"""
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers={"ETag": _INDEX_ETAG})
+    return Response(
+        _INDEX_BYTES,
+        media_type="text/html; charset=utf-8",
+        headers={"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=300"}
+    )
+
+# Mounted last so it never shadows the /api routes
+app.mount("/", StaticFiles(directory=_STATIC_DIR, html=True), name="static")
+
+def _uvicorn_impls() -> dict:
+    """Prefer the C event loop and HTTP parser when they are installed"""
+    impls = {}
+    try:
+        import uvloop  # noqa: F401
+        impls["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        impls["http"] = "httptools"
+    except ImportError:
+        pass
+    return impls
+
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # App passed as an import string so uvicorn can fork workers; one per
+    # core by default (WEB_CONCURRENCY overrides). The in-process caches
+    # are per-worker — sharing them needs an external store like Redis.
+    uvicorn.run(
+        "web_server:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        **_uvicorn_impls()
+    )
\ No newline at end of file